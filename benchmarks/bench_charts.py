@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+"""
+Benchmarks for every chart type, sweeping rows x series columns.
+
+The data write in Chart.__init__, Chart.add_series and ExcelChart.save are timed separately, the output size and
+the peak memory are recorded too. The synthetic frames take their column types and value ranges from the samples
+in excelchart/data, reading them needs openpyxl.
+
+The classes follow the asv conventions, run ``python benchmarks/bench_charts.py`` for a quick report, see --help.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from excelchart import Chart, ExcelChart  # noqa: E402
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'excelchart', 'data')
+
+SAMPLES = {
+    'column': 'bar.xlsx', 'bar': 'bar2.xlsx', 'line': 'line.xlsx', 'pie': 'pie.xlsx', 'radar': 'radar.xlsx',
+    'scatter': 'scatter.xlsx', 'area': 'bar.xlsx', 'doughnut': 'pie.xlsx', 'stock': 'stock.xlsx'
+}
+
+# Series columns each chart type can plot, None sweeps the requested counts.
+SERIES = {'pie': 1, 'doughnut': 1, 'stock': 3}
+
+_samples = {}
+
+
+def sample(kind):
+    """ The bundled sample frame of a chart type.
+
+    :param kind: string
+    :return: DataFrame
+    """
+    if kind not in _samples:
+        _samples[kind] = pd.read_excel(os.path.join(DATA, SAMPLES[kind]))
+    return _samples[kind]
+
+
+def synthetic_frame(kind, rows, cols, seed=0):
+    """ A frame shaped like the chart type's sample, with `rows` rows and `cols` series columns.
+
+    The categories column keeps the sample's type, strings, integers or dates. The series columns are drawn
+    from the sample's value range and keep its dtype.
+
+    :param kind: string
+    :param rows: int
+    :param cols: int
+    :param seed: int, default 0
+    :return: DataFrame
+    """
+    template = sample(kind)
+    rng = np.random.default_rng(seed)
+    first = template.iloc[:, 0]
+    cols = SERIES.get(kind, cols)
+
+    if first.dtype.kind == 'M':
+        categories = pd.date_range(first.iloc[0], periods=rows, freq='D')
+    elif first.dtype.kind in 'iuf':
+        categories = np.arange(first.iloc[0], first.iloc[0] + rows)
+    else:
+        categories = np.array(['%s%d' % (first.iloc[num % len(first)], num) for num in range(rows)], dtype=object)
+
+    values = template.iloc[:, 1:]
+    low, high = values.min().min(), values.max().max()
+    data = {template.columns[0]: categories}
+
+    for col in range(cols):
+        column = rng.uniform(low, high, rows)
+        data['series%d' % (col + 1)] = column.astype(values.dtypes.iloc[0]) if values.dtypes.iloc[0].kind == 'i' \
+            else column
+
+    return pd.DataFrame(data)
+
+
+class _Phases(object):
+    """ Shared sweep, each timing runs once on a fresh workbook made by setup. """
+
+    params = (list(SAMPLES), [1000, 10000], [1, 4, 16])
+    param_names = ['kind', 'rows', 'cols']
+    number = 1
+    repeat = 5
+
+    def setup(self, kind, rows, cols):
+        self.frame = synthetic_frame(kind, rows, cols)
+        self.ec = ExcelChart(output='bytes')
+
+    def write(self, kind):
+        return Chart(self.ec._workbook, self.frame, chart_type=kind, date_parser=kind == 'stock',
+                     formats=self.ec._formats)
+
+
+class TimeWrite(_Phases):
+    """ The data write of Chart.__init__. """
+
+    def time_write(self, kind, rows, cols):
+        self.write(kind)
+
+
+class TimeAddSeries(_Phases):
+    """ Chart.add_series on data that is already written. """
+
+    def setup(self, kind, rows, cols):
+        _Phases.setup(self, kind, rows, cols)
+        self.chart = self.write(kind)
+
+    def time_add_series(self, kind, rows, cols):
+        self.chart.add_series(data_labels=False)
+
+
+class TimeSave(_Phases):
+    """ ExcelChart.save, the chart options, inserting the chart and closing the workbook. """
+
+    def setup(self, kind, rows, cols):
+        _Phases.setup(self, kind, rows, cols)
+        chart = self.write(kind)
+        chart.add_series(data_labels=False)
+        self.ec._charts.append((chart, None))
+
+    def time_save(self, kind, rows, cols):
+        self.ec.save()
+
+
+class Output(_Phases):
+    """ Output size and peak memory of building and saving one chart. """
+
+    def build(self, kind):
+        getattr(self.ec, kind)(self.frame)
+        return self.ec.save()
+
+    def track_size(self, kind, rows, cols):
+        return len(self.build(kind))
+
+    track_size.unit = 'bytes'
+
+    def peakmem_build(self, kind, rows, cols):
+        self.build(kind)
+
+
+def peak_memory(bench, kind, rows, cols):
+    """ Peak traced Python memory of building and saving one chart.
+
+    :return: int, bytes
+    """
+    bench.setup(kind, rows, cols)
+    tracemalloc.start()
+    try:
+        bench.build(kind)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(bench, method, kind, rows, cols, repeat):
+    """ Best time of a phase, setup runs outside the timing before every repeat.
+
+    :return: float, seconds
+    """
+    best = None
+    for _ in range(repeat):
+        bench.setup(kind, rows, cols)
+        seconds = timeit.timeit(lambda: getattr(bench, method)(kind, rows, cols), number=1)
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--kinds', nargs='+', default=list(SAMPLES), choices=list(SAMPLES))
+    parser.add_argument('--rows', nargs='+', type=int, default=[1000, 10000])
+    parser.add_argument('--cols', nargs='+', type=int, default=[1, 4, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print('%-9s %7s %5s %10s %10s %10s %10s %10s'
+          % ('kind', 'rows', 'cols', 'write ms', 'series ms', 'save ms', 'size KB', 'peak MB'))
+
+    for kind in args.kinds:
+        for rows in args.rows:
+            for cols in sorted(set(SERIES.get(kind, col) for col in args.cols)):
+                write = measure(TimeWrite(), 'time_write', kind, rows, cols, args.repeat)
+                series = measure(TimeAddSeries(), 'time_add_series', kind, rows, cols, args.repeat)
+                save = measure(TimeSave(), 'time_save', kind, rows, cols, args.repeat)
+
+                output = Output()
+                output.setup(kind, rows, cols)
+                size = output.track_size(kind, rows, cols)
+
+                peak = peak_memory(Output(), kind, rows, cols)
+
+                print('%-9s %7d %5d %10.1f %10.2f %10.1f %10.1f %10.1f'
+                      % (kind, rows, cols, write * 1e3, series * 1e3, save * 1e3, size / 1024., peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
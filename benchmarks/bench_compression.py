@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+"""
+Speed and size of ExcelChart.save() for each compression level on typical report shapes.
+
+- report: one chart of every type, 10000 rows and 3 series each.
+- dashboard: 100 line charts of 500 rows on one grid sheet.
+- wide: a 50000 rows line chart with 8 series, streamed, so save() is mostly the zip.
+
+The classes follow the asv conventions, run ``python benchmarks/bench_compression.py`` for a quick report.
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from excelchart import ExcelChart  # noqa: E402
+
+LEVELS = [None, 0, 1, 3, 6, 9]
+SHAPES = ['report', 'dashboard', 'wide']
+KINDS = ['column', 'bar', 'line', 'pie', 'radar', 'scatter', 'area', 'doughnut', 'stock']
+
+
+def frame(rows, cols, seed=0):
+    """ Dates followed by `cols` random walks.
+
+    :param rows: int
+    :param cols: int
+    :param seed: int, default 0
+    :return: DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    data = {'date': pd.date_range('2020-01-01', periods=rows, freq='h')}
+    for col in range(cols):
+        data['series%d' % (col + 1)] = 100 + rng.standard_normal(rows).cumsum().round(2)
+    return pd.DataFrame(data)
+
+
+def build(shape, compression):
+    """ An ExcelChart of the shape with every chart added, ready to save.
+
+    :param shape: string
+    :param compression: int or None
+    :return: ExcelChart
+    """
+    if shape == 'report':
+        ec = ExcelChart(output='bytes', compression=compression)
+        data = frame(10000, 3)
+        for kind in KINDS:
+            getattr(ec, kind)(data.iloc[:, :2] if kind in ('pie', 'doughnut') else data)
+    elif shape == 'dashboard':
+        ec = ExcelChart(output='bytes', compression=compression)
+        for num in range(100):
+            ec.line(frame(500, 2, seed=num), sheet='dashboard')
+    else:
+        ec = ExcelChart(output='bytes', compression=compression, streaming=True)
+        ec.line(frame(50000, 8))
+    return ec
+
+
+class Compression(object):
+    """ ExcelChart.save() of each shape and compression level, None is xlsxwriter's default level 6. """
+
+    params = (SHAPES, LEVELS)
+    param_names = ['shape', 'compression']
+    number = 1
+    repeat = 3
+
+    def setup(self, shape, compression):
+        self.ec = build(shape, compression)
+
+    def time_save(self, shape, compression):
+        self.ec.save()
+
+    def track_size(self, shape, compression):
+        return len(self.ec.save())
+
+    track_size.unit = 'bytes'
+
+
+def main():
+    bench = Compression()
+    print('%-10s %11s %10s %10s %8s %8s' % ('shape', 'compression', 'save ms', 'size KB', 'time', 'size'))
+
+    for shape in SHAPES:
+        baseline = None
+        for level in LEVELS:
+            seconds = []
+            for _ in range(bench.repeat):
+                bench.setup(shape, level)
+                seconds.append(timeit.timeit(lambda: bench.time_save(shape, level), number=1))
+            bench.setup(shape, level)
+            size = bench.track_size(shape, level)
+
+            if baseline is None:
+                baseline = min(seconds), size
+            print('%-10s %11s %10.1f %10.1f %7.2fx %7.2fx' % (shape, 'default' if level is None else level,
+                                                              min(seconds) * 1e3, size / 1024.,
+                                                              min(seconds) / baseline[0], size / float(baseline[1])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+"""
+Benchmarks for the per chart setup cost of the builders against a compiled ChartSpec.
+
+The classes follow the asv conventions, run ``python benchmarks/bench_spec.py`` for a quick report.
+"""
+
+import io
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from excelchart import ChartSpec, ExcelChart  # noqa: E402
+from excelchart.excelchart import _style_axes  # noqa: E402
+
+OPTIONS = {
+    'title': 'Sales', 'legend': 'top', 'x_grid': True, 'y_grid': True, 'x_limit': (0, 6), 'y_limit': (0, 100),
+    'x_title': 'Region', 'y_title': 'Amount', 'table': True, 'size': (640, 400), 'data_labels': True
+}
+
+
+class ChartSetup(object):
+    """ Create many small column charts with the same layout through column() and through apply(). """
+
+    params = [100, 1000]
+    param_names = ['charts']
+
+    def setup(self, charts):
+        self.frame = pd.DataFrame({'region': list('ABCDEF'), 'north': range(6), 'south': range(6, 12)})
+        self.spec = ChartSpec('column', **OPTIONS)
+
+    def time_builder(self, charts):
+        ec = ExcelChart(io.BytesIO())
+        for _ in range(charts):
+            ec.column(self.frame, **OPTIONS)
+
+    def time_spec(self, charts):
+        ec = ExcelChart(io.BytesIO())
+        for _ in range(charts):
+            ec.apply(self.spec, self.frame)
+
+    def time_compile(self, charts):
+        for _ in range(charts):
+            ChartSpec('column', **OPTIONS)
+
+
+class ChartOptions(object):
+    """ Only the option step of the setup, the series and set_* payloads on charts that already exist. """
+
+    params = [100, 1000]
+    param_names = ['charts']
+
+    def setup(self, charts):
+        frame = pd.DataFrame({'region': list('ABCDEF'), 'north': range(6), 'south': range(6, 12)})
+        ec = ExcelChart(io.BytesIO())
+        self.charts = [ec._chart(frame, None, 'column') for _ in range(charts)]
+        self.spec = ChartSpec('column', **OPTIONS)
+
+    def time_builder_options(self, charts):
+        for chart in self.charts:
+            _style_axes(chart, **OPTIONS)
+
+    def time_spec_options(self, charts):
+        for chart in self.charts:
+            self.spec.apply(chart)
+
+
+def report(title, bench, builder, spec):
+    print(title)
+    print('%8s %16s %16s %8s' % ('charts', 'builder', 'spec', 'speedup'))
+    for charts in bench.params:
+        bench.setup(charts)
+        before = min(timeit.repeat(lambda: builder(charts), number=1, repeat=5))
+        after = min(timeit.repeat(lambda: spec(charts), number=1, repeat=5))
+        print('%8d %11.1f us/chart %11.1f us/chart %7.2fx'
+              % (charts, before / charts * 1e6, after / charts * 1e6, before / after))
+
+
+def main():
+    setup = ChartSetup()
+    report('whole chart setup', setup, setup.time_builder, setup.time_spec)
+    options = ChartOptions()
+    report('option step only', options, options.time_builder_options, options.time_spec_options)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+"""
+Benchmarks for writing chart data to the worksheet.
+
+The classes follow the asv conventions, run ``python benchmarks/bench_write.py`` for a quick report.
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from excelchart import Chart  # noqa: E402
+
+
+def mixed_frame(rows, cols, seed=0):
+    """ A wide frame with one string category column and `cols` float columns.
+
+    :param rows: int
+    :param cols: int
+    :param seed: int, default 0
+    :return: DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    data = {'category': np.array(['north', 'south', 'east', 'west'])[rng.integers(0, 4, rows)]}
+    for col in range(cols):
+        data['series%d' % col] = rng.random(rows)
+    return pd.DataFrame(data)
+
+
+class WideMixedFrame(object):
+    """ Write a mixed string/float frame through the object upcast and through the column writer. """
+
+    params = ([10000, 50000], [10, 50])
+    param_names = ['rows', 'cols']
+
+    def setup(self, rows, cols):
+        self.frame = mixed_frame(rows, cols)
+        self.filename = os.path.join(tempfile.mkdtemp(), 'bench.xlsx')
+
+    def time_object_upcast(self, rows, cols):
+        workbook = xlsxwriter.Workbook(self.filename)
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row('A1', self.frame.columns)
+        data = self.frame.values
+        for row in range(rows):
+            worksheet.write_row(row + 1, 0, data[row])
+
+    def time_column_writer(self, rows, cols):
+        workbook = xlsxwriter.Workbook(self.filename)
+        Chart(workbook, self.frame, chart_type='column')
+
+    def track_cells(self, rows, cols):
+        return rows * (cols + 1)
+
+
+def main():
+    bench = WideMixedFrame()
+    print('%8s %6s %18s %18s %8s' % ('rows', 'cols', 'object upcast', 'column writer', 'speedup'))
+    for rows in WideMixedFrame.params[0]:
+        for cols in WideMixedFrame.params[1]:
+            bench.setup(rows, cols)
+            cells = bench.track_cells(rows, cols)
+            before = min(timeit.repeat(lambda: bench.time_object_upcast(rows, cols), number=1, repeat=3))
+            after = min(timeit.repeat(lambda: bench.time_column_writer(rows, cols), number=1, repeat=3))
+            print('%8d %6d %11.0f cells/s %11.0f cells/s %7.2fx'
+                  % (rows, cols, cells / before, cells / after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,8 +5,7 @@
 Elementary Math Library. (For demonstration purpose only)
 """
 
-from .excelchart import ExcelChart
-from .excelchart import Chart
+import importlib
 
 __version__ = "0.0.1a1"
 __short_description__ = "Simply create a excel chart."
@@ -17,5 +16,29 @@ __maintainer__ = "Jan Yang"
 __maintainer_email__ = "yang.jiada@foxmail.com"
 __github_username__ = "yangjiada"
 
+# The public names and their submodules, a submodule is imported on first access so that
+# `import excelchart` and its metadata stay cheap.
+_exports = {
+    'ExcelChart': 'excelchart',
+    'Chart': 'excelchart',
+    'ChartSpec': 'excelchart',
+    'FormatCache': 'excelchart',
+    'instrument': 'excelchart',
+    'log_event': 'excelchart',
+    'render_batch': 'batch',
+}
 
+__all__ = list(_exports)
 
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    value = getattr(importlib.import_module('.' + _exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,411 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+"""
+Append rows to a worksheet of an existing workbook and extend the charts that plot it.
+
+The new rows are spliced into the sheet XML after its last row, strings as inline strings so the shared
+string table isn't touched. Chart ranges on the sheet that end at its last row are extended to the new last
+row and their cached values are dropped, Excel reads them from the cells again. Every other part of the
+package is copied with its compressed bytes, so the update costs the sheet and the new rows, not the charts,
+styles and other sheets.
+"""
+
+import copy
+import datetime
+import math
+import os
+import posixpath
+import re
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape, unescape
+
+from xlsxwriter.utility import xl_cell_to_rowcol, xl_col_to_name
+
+from .excelchart import _as_frame, _excel_serials, pd
+
+_EPOCH = datetime.datetime(1899, 12, 30)
+
+_sheet_pattern = re.compile(r'<sheet\b[^>]*?\bname="([^"]*)"[^>]*?\br:id="([^"]*)"')
+_relationship_pattern = re.compile(r'<Relationship\b[^>]*?\bId="([^"]*)"[^>]*?\bTarget="([^"]*)"')
+_cell_pattern = re.compile(r'<c\b([^>]*?)/?>')
+_attribute_pattern = re.compile(r'(\w+)="([^"]*)"')
+_formula_pattern = re.compile(r'<c:f>([^<]*)</c:f>')
+_cache_pattern = re.compile(r'<c:(numCache|strCache)>.*?</c:\1>', re.S)
+_range_pattern = re.compile(r'^\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$')
+_font_pattern = re.compile(r'<font\b[^>]*?(?:/>|>(.*?)</font>)', re.S)
+_bold_pattern = re.compile(r'<b(?:\s+val="(?:1|true)")?\s*/>')
+_xf_pattern = re.compile(r'<xf\b([^>]*?)/?>')
+
+
+def _sheet_part(archive, sheet_name):
+    """ The zip part name of a worksheet.
+
+    :param archive: ZipFile
+    :param sheet_name: string
+    :return: string
+    """
+    workbook = archive.read('xl/workbook.xml').decode('utf-8')
+    ids = {unescape(name, {'&quot;': '"', '&apos;': "'"}): rid for name, rid in _sheet_pattern.findall(workbook)}
+
+    if sheet_name not in ids:
+        raise ValueError('No worksheet %r in the workbook, it has %s.' % (sheet_name, list(ids)))
+
+    targets = dict(_relationship_pattern.findall(archive.read('xl/_rels/workbook.xml.rels').decode('utf-8')))
+    target = targets[ids[sheet_name]]
+
+    return target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+
+
+def _bold_styles(styles):
+    """ The cell styles with a bold font, the header rows written by ExcelChart have one of them.
+
+    :param styles: string, the styles.xml XML
+    :return: set, the style indexes as they appear in the s attribute of a cell
+    """
+    fonts = re.search(r'<fonts\b[^>]*>(.*?)</fonts>', styles, re.S)
+    cell_xfs = re.search(r'<cellXfs\b[^>]*>(.*?)</cellXfs>', styles, re.S)
+
+    if not fonts or not cell_xfs:
+        return set()
+
+    bold = {str(num) for num, font in enumerate(_font_pattern.findall(fonts.group(1))) if _bold_pattern.search(font)}
+
+    return {str(num) for num, attributes in enumerate(_xf_pattern.findall(cell_xfs.group(1)))
+            if dict(_attribute_pattern.findall(attributes)).get('fontId', '0') in bold}
+
+
+def _rows_up(xml):
+    """ The rows of the sheet data from the last one up.
+
+    :param xml: string, the sheet XML
+    :return: generator of (row number, dict of column -> (style, type))
+    """
+    end = xml.find('</sheetData>')
+
+    while end > 0:
+        start = xml.rfind('<row ', 0, end)
+        if start < 0:
+            return
+
+        row = dict(_attribute_pattern.findall(xml[start:xml.find('>', start)]))
+        cells = {}
+
+        # The row runs to the next row or the end of the sheet data.
+        for attributes in _cell_pattern.findall(xml[start:end]):
+            cell = dict(_attribute_pattern.findall(attributes))
+            cells[xl_cell_to_rowcol(cell['r'])[1]] = cell.get('s'), cell.get('t')
+
+        yield int(row['r']), cells
+        end = start
+
+
+def _dimension_width(xml):
+    """ The number of columns in the dimension of the sheet.
+
+    :param xml: string, the sheet XML
+    :return: int or None without a dimension
+    """
+    match = re.search(r'<dimension ref="([^"]*)"/>', xml)
+    if not match:
+        return None
+
+    first, _, last = match.group(1).partition(':')
+    return xl_cell_to_rowcol(last or first)[1] + 1
+
+
+def _last_row(xml, header_styles=(), width=None):
+    """ The number of the last row of the sheet data, the width of its block and the cell style of each column.
+
+    The rows are read up until every column of the block has a style, a column takes the style of its last
+    cell and a blank cell leaves the style of the cell above. The header row, the last row whose cells all
+    have a bold style, numbers included, ends the block and its own styles aren't used. Without `width` the
+    dimension of the sheet bounds the columns to look for.
+
+    :param xml: string, the sheet XML
+    :param header_styles: set, default ()
+        The styles of the header cells, see _bold_styles.
+    :param width: int, default None
+        The columns of the block when known, see _block_width.
+    :return: tuple, (row number, columns or None when unknown, dict of column -> style, header row number or
+        None when it wasn't reached), (0, None, {}, None) for an empty sheet
+    """
+    last = 0
+    styles = {}
+    bound = width or _dimension_width(xml)
+
+    for number, cells in _rows_up(xml):
+        last = last or number
+
+        if cells and all(style in header_styles for style, _ in cells.values()):
+            return last, width or max(cells) + 1, styles, number
+
+        for col, (style, _) in cells.items():
+            styles.setdefault(col, style)
+
+        if bound and all(col in styles for col in range(bound)):
+            break
+
+    return last, width, styles, None
+
+
+def _block_width(charts, sheet_name, last_row):
+    """ The number of columns of the block ending at the last row, from the chart ranges on the sheet ending there.
+
+    :param charts: iterable of string, the chart XML
+    :param sheet_name: string
+    :param last_row: int
+    :return: int or None when no chart plots the block
+    """
+    width = 0
+
+    for xml in charts:
+        for match in _formula_pattern.finditer(xml):
+            sheet, cells = _sheet_of(unescape(match.group(1), {'&quot;': '"', '&apos;': "'"}))
+            cell_range = _range_pattern.match(cells)
+
+            if sheet == sheet_name and cell_range and int(cell_range.group(4) or cell_range.group(2)) == last_row:
+                last_col = cell_range.group(3) or cell_range.group(1)
+                width = max(width, xl_cell_to_rowcol('%s1' % last_col)[1] + 1)
+
+    return width or None
+
+
+def _cells(column):
+    """ The XML of each value of a column without its reference, None for a blank cell.
+
+    :param column: Series
+    :return: list, tuples of (type attribute, value XML) or None
+    """
+    kind = column.dtype.kind
+
+    if kind == 'M':
+        return [None if math.isnan(value) else ('', '<v>%r</v>' % value) for value in _excel_serials(column).tolist()]
+
+    cells = []
+    for value in column.tolist():
+        if isinstance(value, bool):
+            cells.append((' t="b"', '<v>%d</v>' % value))
+        elif value is None or pd.isna(value) is True:
+            cells.append(None)
+        elif isinstance(value, (int, float)):
+            cells.append(('', '<v>%r</v>' % value) if math.isfinite(value) else None)
+        elif isinstance(value, datetime.datetime):
+            cells.append(('', '<v>%r</v>' % ((value.replace(tzinfo=None) - _EPOCH) / datetime.timedelta(days=1))))
+        else:
+            text = str(value)
+            space = ' xml:space="preserve"' if text != text.strip() else ''
+            cells.append((' t="inlineStr"', '<is><t%s>%s</t></is>' % (space, escape(text))))
+
+    return cells
+
+
+def _rows_xml(frame, first_row, styles):
+    """ The XML of the new rows.
+
+    :param frame: DataFrame
+    :param first_row: int, the 1-based number of the first new row
+    :param styles: dict, column -> style of the previous last row
+    :return: string
+    """
+    columns = [_cells(frame.iloc[:, col]) for col in range(frame.shape[1])]
+    names = [xl_col_to_name(col) for col in range(frame.shape[1])]
+    style = [' s="%s"' % styles[col] if styles.get(col) else '' for col in range(frame.shape[1])]
+    rows = []
+
+    for num in range(len(frame)):
+        row = first_row + num
+        cells = ''.join('<c r="%s%d"%s%s>%s</c>' % (names[col], row, style[col], columns[col][num][0],
+                                                    columns[col][num][1])
+                        for col in range(len(columns)) if columns[col][num] is not None)
+        rows.append('<row r="%d">%s</row>' % (row, cells))
+
+    return ''.join(rows)
+
+
+def _patch_sheet(xml, frame, header_styles=(), width=None):
+    """ Add the frame's rows after the last row of the sheet XML and update its dimension.
+
+    :param xml: string
+    :param frame: DataFrame
+    :param header_styles: set, default ()
+        The styles of the header cells, see _bold_styles.
+    :param width: int, default None
+        The columns of the block, see _last_row.
+    :return: tuple, (new XML, old last row, new last row, header row number or None)
+    """
+    last_row, width, styles, header_row = _last_row(xml, header_styles, width)
+    new_last = last_row + len(frame)
+
+    if width is not None and width != frame.shape[1]:
+        raise ValueError('The sheet has %d columns, the new rows have %d.' % (width, frame.shape[1]))
+
+    if '</sheetData>' in xml:
+        end = xml.rfind('</sheetData>')
+        xml = xml[:end] + _rows_xml(frame, last_row + 1, styles) + xml[end:]
+    else:
+        xml = xml.replace('<sheetData/>', '<sheetData>%s</sheetData>' % _rows_xml(frame, last_row + 1, styles), 1)
+
+    match = re.search(r'<dimension ref="([^"]*)"/>', xml)
+
+    if match:
+        first, _, last = match.group(1).partition(':')
+        last_col = xl_col_to_name(max(xl_cell_to_rowcol(last or first)[1], frame.shape[1] - 1))
+        xml = xml[:match.start()] + '<dimension ref="%s:%s%d"/>' % (first, last_col, new_last) + xml[match.end():]
+
+    return xml, last_row, new_last, header_row
+
+
+def _sheet_of(reference):
+    """ Split a formula reference into its unquoted sheet name and range.
+
+    :param reference: string, e.g. 'Sheet 1'!$A$2:$A$7
+    :return: tuple, (sheet name, range)
+    """
+    sheet, _, cells = reference.rpartition('!')
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, cells
+
+
+def _patch_chart(xml, sheet_name, last_row, new_last, header_row=None):
+    """ Extend the chart ranges on the sheet that end at its last row, dropping their caches.
+
+    xlsxwriter writes the ranges of a 1 row block as single cells, they are extended too unless the last row
+    is the header, whose cells are the series names.
+
+    :param xml: string, the chart XML
+    :param sheet_name: string
+    :param last_row: int
+    :param new_last: int
+    :param header_row: int, default None
+    :return: string or None when nothing changed
+    """
+    parts = []
+    position = 0
+    changed = False
+
+    for match in _formula_pattern.finditer(xml):
+        reference = unescape(match.group(1), {'&quot;': '"', '&apos;': "'"})
+        sheet, cells = _sheet_of(reference)
+        cell_range = _range_pattern.match(cells)
+
+        if sheet != sheet_name or not cell_range or int(cell_range.group(4) or cell_range.group(2)) != last_row:
+            continue
+        if not cell_range.group(3) and last_row == header_row:
+            continue
+
+        sheet_ref = reference[:-len(cells)]
+        extended = '%s$%s$%s:$%s$%d' % (sheet_ref, cell_range.group(1), cell_range.group(2),
+                                        cell_range.group(3) or cell_range.group(1), new_last)
+        # The cache follows the formula in the same numRef or strRef.
+        ends = [xml.find(tag, match.end()) for tag in ('</c:numRef>', '</c:strRef>')]
+        end = min([end for end in ends if end >= 0] or [match.end()])
+
+        parts.append(xml[position:match.start()])
+        parts.append('<c:f>%s</c:f>' % escape(extended))
+        parts.append(_cache_pattern.sub('', xml[match.end():end]))
+        position = end
+        changed = True
+
+    if not changed:
+        return None
+
+    parts.append(xml[position:])
+    return ''.join(parts)
+
+
+def _copy_raw(source, target, info):
+    """ Copy a zip entry with its compressed bytes, it isn't decompressed and compressed again.
+
+    zipfile has no public API for this, the local header and data are copied as they are and the entry is
+    registered for the central directory the way ZipFile.write() does it.
+
+    :param source: ZipFile, open for reading
+    :param target: ZipFile, open for writing
+    :param info: ZipInfo
+    :return:
+    """
+    if info.flag_bits & 0x08:
+        # The sizes follow the data in a descriptor, copy it the slow way.
+        target.writestr(info, source.read(info))
+        return
+
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(30)
+    remaining = 30 + int.from_bytes(header[26:28], 'little') + int.from_bytes(header[28:30], 'little') + \
+        info.compress_size - len(header)
+
+    entry = copy.copy(info)
+    entry.header_offset = target.fp.tell()
+    target.fp.write(header)
+
+    while remaining > 0:
+        block = source.fp.read(min(remaining, 1 << 20))
+        if not block:
+            raise zipfile.BadZipFile('Truncated entry %r.' % info.filename)
+        target.fp.write(block)
+        remaining -= len(block)
+
+    target.filelist.append(entry)
+    target.NameToInfo[entry.filename] = entry
+    target.start_dir = target.fp.tell()
+
+
+def append_rows(path, sheet_name, new_rows, columns=None, index=False):
+    """ Append rows to a worksheet of a workbook written by ExcelChart and extend the charts that plot it.
+
+    The rows are written after the last row of the sheet from column A, taking the cell formats of that row,
+    e.g. the date format of a stock chart. Chart ranges on the sheet that end at its last row, the categories
+    and values of add_series, grow to the new last row. The file is replaced once the new one is complete.
+
+    :param path: string
+    :param sheet_name: string
+    :param new_rows: DataFrame or any data the builders accept, without the header
+    :param columns: list, default None
+    :param index: bool, default False
+        See ExcelChart.column().
+    :return: int, the new last row, 1-based
+    """
+    frame = _as_frame(new_rows, columns, index)
+    if not isinstance(frame, pd.DataFrame):
+        frame = pd.concat(list(frame), ignore_index=True)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(suffix='.xlsx', dir=directory)
+    os.close(handle)
+
+    try:
+        with zipfile.ZipFile(path) as source, zipfile.ZipFile(temporary, 'w', zipfile.ZIP_DEFLATED) as target:
+            sheet_part = _sheet_part(source, sheet_name)
+            header_styles = _bold_styles(source.read('xl/styles.xml').decode('utf-8')) \
+                if 'xl/styles.xml' in source.namelist() else set()
+            charts = {}
+            if len(frame):
+                charts = {info.filename: source.read(info).decode('utf-8') for info in source.infolist()
+                          if info.filename.startswith('xl/charts/') and info.filename.endswith('.xml')}
+
+            xml = source.read(sheet_part).decode('utf-8')
+            width = _block_width(charts.values(), sheet_name, next(_rows_up(xml), (0, None))[0])
+            xml, last_row, new_last, header_row = _patch_sheet(xml, frame, header_styles, width)
+
+            for info in source.infolist():
+                if info.filename == sheet_part:
+                    target.writestr(info, xml.encode('utf-8'))
+                    continue
+
+                if info.filename in charts:
+                    chart = _patch_chart(charts[info.filename], sheet_name, last_row, new_last, header_row)
+                    if chart is not None:
+                        target.writestr(info, chart.encode('utf-8'))
+                        continue
+
+                _copy_raw(source, target, info)
+
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+    return new_last
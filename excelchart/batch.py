@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+"""
+Render many workbooks across a process pool.
+
+A job is a dict::
+
+    {
+        'filename': 'report.xlsx',
+        'options': {'streaming': True},          # ExcelChart keyword arguments, optional
+        'charts': [
+            {'kind': 'line', 'frame': frame, 'title': 'Sales'},   # builder name, frame and its arguments
+        ],
+    }
+
+A frame can be any data the builders accept, with their `columns` and `index` arguments, chunks are
+concatenated into one frame before it is shared. The numeric and datetime columns of every frame are copied
+once into a shared memory segment and the worker reads them from there, only object and extension columns
+are pickled.
+"""
+
+import concurrent.futures
+import os
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .excelchart import ExcelChart, _as_frame
+
+
+def _shareable(column):
+    """ Whether a column is a plain numpy array that can be copied into shared memory.
+
+    :param column: Series
+    :return: bool
+    """
+    return isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biufmM'
+
+
+def _share_frame(frame):
+    """ Copy the plain columns of a frame into one shared memory segment.
+
+    :param frame: DataFrame
+    :return: tuple, (descriptor, SharedMemory or None)
+    """
+    columns = [frame.iloc[:, col] for col in range(frame.shape[1])]
+    offsets = []
+    size = 0
+
+    for column in columns:
+        # An empty column has nothing to share, it is pickled with the others.
+        if _shareable(column) and len(column):
+            offsets.append(size)
+            size += -(-column.dtype.itemsize * len(column) // 8) * 8
+        else:
+            offsets.append(None)
+
+    shm = shared_memory.SharedMemory(create=True, size=size) if size else None
+    data = []
+
+    for column, offset in zip(columns, offsets):
+        if offset is None:
+            data.append(('pickle', column))
+        else:
+            view = np.ndarray(len(column), dtype=column.dtype, buffer=shm.buf, offset=offset)
+            view[:] = column.to_numpy()
+            del view
+            data.append(('shared', column.dtype.str, offset, len(column)))
+
+    descriptor = {'name': shm.name if shm else None, 'columns': list(frame.columns), 'data': data}
+    return descriptor, shm
+
+
+def _attach(name):
+    """ Attach a shared memory segment that is owned and unlinked by the parent process.
+
+    Workers share the parent's resource tracker, registering the segment again there is harmless.
+
+    :param name: string
+    :return: SharedMemory
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _load_frame(descriptor, segments):
+    """ Rebuild a frame from its descriptor, the plain columns are views on the shared memory.
+
+    :param descriptor: dict
+    :param segments: list, attached segments are appended to it
+    :return: DataFrame
+    """
+    shm = None
+    if descriptor['name']:
+        shm = _attach(descriptor['name'])
+        segments.append(shm)
+
+    arrays = {}
+    for num, item in enumerate(descriptor['data']):
+        if item[0] == 'pickle':
+            arrays[num] = item[1].reset_index(drop=True)
+        else:
+            _, dtype, offset, length = item
+            arrays[num] = np.ndarray(length, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+
+    frame = pd.DataFrame(arrays, copy=False)
+    frame.columns = descriptor['columns']
+    return frame
+
+
+def _render(job, segments):
+    """ Build and save one workbook.
+
+    :param job: dict, a job whose frames are descriptors
+    :param segments: list
+    :return:
+    """
+    ec = ExcelChart(job['filename'], **job.get('options', {}))
+
+    for spec in job['charts']:
+        spec = dict(spec)
+        kind = spec.pop('kind')
+        frame = _load_frame(spec.pop('frame'), segments)
+        getattr(ec, kind)(frame, **spec)
+
+    ec.save()
+
+
+def _run_job(job):
+    """ Worker entry, render a job and report its timing or error instead of raising.
+
+    :param job: dict
+    :return: dict
+    """
+    segments = []
+    start = time.perf_counter()
+    error = None
+
+    try:
+        _render(job, segments)
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        for shm in segments:
+            try:
+                shm.close()
+            except BufferError:
+                pass
+
+    return {'filename': job['filename'], 'seconds': time.perf_counter() - start, 'error': error}
+
+
+def _prepare(job):
+    """ Replace the frames of a job with shared memory descriptors, chunked frames are concatenated first.
+
+    :param job: dict
+    :return: tuple, (job, list of SharedMemory)
+    """
+    segments = []
+    charts = []
+
+    try:
+        for spec in job['charts']:
+            spec = dict(spec)
+            frame = _as_frame(spec['frame'], spec.pop('columns', None), spec.pop('index', False))
+            if not isinstance(frame, pd.DataFrame):
+                frame = pd.concat(frame, ignore_index=True)
+
+            descriptor, shm = _share_frame(frame)
+            spec['frame'] = descriptor
+            charts.append(spec)
+
+            if shm is not None:
+                segments.append(shm)
+    except Exception:
+        _release(segments)
+        raise
+
+    prepared = dict(job)
+    prepared['charts'] = charts
+    return prepared, segments
+
+
+def _release(segments):
+    """ Close and unlink the shared memory of a finished job.
+
+    :param segments: list of SharedMemory
+    :return:
+    """
+    for shm in segments:
+        shm.close()
+        shm.unlink()
+
+
+def render_batch(jobs, workers=None):
+    """ Render the jobs across a process pool.
+
+    A failing job doesn't stop the batch, its traceback is reported in the result. At most twice the
+    number of workers jobs are in flight, so only their frames are held in shared memory.
+
+    :param jobs: iterable of dict, see the module docstring
+    :param workers: int, default None
+        The number of processes, os.cpu_count() when None.
+    :return: list of dict, {'filename': string, 'seconds': float, 'error': string or None} in job order
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = list(jobs)
+    results = [None] * len(jobs)
+    pending = {}
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        queue = iter(enumerate(jobs))
+
+        def submit():
+            for index, job in queue:
+                start = time.perf_counter()
+                try:
+                    prepared, segments = _prepare(job)
+                except Exception:
+                    results[index] = {'filename': job.get('filename'), 'seconds': time.perf_counter() - start,
+                                      'error': traceback.format_exc()}
+                    continue
+
+                pending[executor.submit(_run_job, prepared)] = (index, job, segments)
+                return
+
+        for _ in range(workers * 2):
+            submit()
+
+        while pending:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                index, job, segments = pending.pop(future)
+                _release(segments)
+
+                try:
+                    results[index] = future.result()
+                except Exception:
+                    results[index] = {'filename': job.get('filename'), 'seconds': None,
+                                      'error': traceback.format_exc()}
+
+                submit()
+
+    return results
@@ -7,59 +7,986 @@
 """
 
 
-import pandas as pd
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import hashlib
+import importlib
+import inspect
+import io
+import itertools
+import json
+import logging
+import numbers
+import os
 import string
+import threading
+import time
 import xlsxwriter
+import xlsxwriter.workbook
+import xlsxwriter.worksheet
+import zipfile
+
+
+class _LazyModule(object):
+    """ A module that is imported on first attribute access.
+
+    pandas and numpy take most of the import time, they are only loaded once a frame is handled.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+asyncio = _LazyModule('asyncio')
+np = _LazyModule('numpy')
+pd = _LazyModule('pandas')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+_hook = contextvars.ContextVar('excelchart_hook', default=None)
+_zip_options = contextvars.ContextVar('excelchart_zip_options', default=None)
+_logger = logging.getLogger('excelchart')
+
+
+def _default_executor():
+    """ The thread pool shared by the async methods of every ExcelChart, one thread per CPU.
+
+    :return: ThreadPoolExecutor
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                              thread_name_prefix='excelchart')
+    return _executor
+
+
+class _NullSpan(object):
+    """ The span of a disabled instrument, it does nothing. """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _Instrument(object):
+    """ Emit timed spans and counters to a hook, both do nothing when the hook is None.
+
+    An event is a dict, {'event': 'span' or 'counter', 'name': string, 'value': seconds or count,
+    'sheet': string or None, 'chart_type': string or None}.
+    """
+    _null_span = _NullSpan()
+
+    def __init__(self, hook=None):
+        """
+
+        :param hook: callable, default None
+        :return:
+        """
+        self.hook = hook
+
+    def span(self, name, sheet=None, chart_type=None):
+        """ Time the block of a with statement.
+
+        :param name: string
+        :param sheet: string, default None
+        :param chart_type: string, default None
+        :return: context manager
+        """
+        if self.hook is None:
+            return self._null_span
+        return self._timed(name, sheet, chart_type)
+
+    @contextlib.contextmanager
+    def _timed(self, name, sheet, chart_type):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.hook({'event': 'span', 'name': name, 'value': time.perf_counter() - start, 'sheet': sheet,
+                       'chart_type': chart_type})
+
+    def count(self, name, value=1, sheet=None, chart_type=None):
+        """ Add to a counter.
+
+        :param name: string
+        :param value: int, default 1
+        :param sheet: string, default None
+        :param chart_type: string, default None
+        :return:
+        """
+        if self.hook is not None:
+            self.hook({'event': 'counter', 'name': name, 'value': value, 'sheet': sheet, 'chart_type': chart_type})
+
+
+_null_instrument = _Instrument()
+
+
+def log_event(event):
+    """ A hook that logs the events to the 'excelchart' logger at DEBUG level.
+
+    :param event: dict
+    :return:
+    """
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug('%s %s=%s sheet=%s chart_type=%s', event['event'], event['name'], event['value'],
+                      event['sheet'], event['chart_type'])
+
+
+@contextlib.contextmanager
+def instrument(hook):
+    """ Use the hook for every ExcelChart created in this context, unless it's given its own.
+
+    The hook is a context variable, asyncio tasks started in the context inherit it.
+
+    :param hook: callable, called with each event dict, see ExcelChart
+    :return: context manager
+    """
+    token = _hook.set(hook)
+    try:
+        yield
+    finally:
+        _hook.reset(token)
+
+
+# The coded string writer fills xlsxwriter's cell table and shared string counts directly. Their layout is
+# checked from 1.0.2 to 3.2.9, other versions write strings with write_string.
+_XLSXWRITER_CODED = ((1, 0), (4, 0))
+
+
+def _xlsxwriter_version():
+    """ The major and minor version of xlsxwriter.
+
+    :return: tuple of int, (0, 0) when it can't be read
+    """
+    parts = xlsxwriter.__version__.split('.')[:2]
+    return tuple(int(part) for part in parts) if all(part.isdigit() for part in parts) else (0, 0)
+
+
+# The worksheet's cell tuple for strings, older xlsxwriter versions name it cell_string_tuple.
+_CellString = None
+if _XLSXWRITER_CODED[0] <= _xlsxwriter_version() < _XLSXWRITER_CODED[1]:
+    _CellString = getattr(xlsxwriter.worksheet, 'CellStringTuple', None) or \
+        getattr(xlsxwriter.worksheet, 'cell_string_tuple', None)
+
+
+def _column_writer(worksheet, col, column, date_format, cell_format=None, row=None):
+    """ Choose the write method for a column from its dtype.
+
+    Each column keeps its own dtype, numbers go to write_number, datetimes to write_number as Excel
+    serials with the date format and strings to write_string, only mixed object columns fall back to
+    the generic write. String and categorical columns are written by their codes, see _coded_writer,
+    when the first row is given. Missing values, NaN NaT None and NA, and infinities are found once
+    for the column, their cells are left blank.
+
+    :param worksheet: Worksheet
+    :param col: int
+    :param column: Series
+    :param date_format: Format, used by datetime columns
+    :param cell_format: Format, default None
+    :param row: int, default None
+        The row of the first value.
+    :return: tuple, (col, write, values, cell_format, missing), missing is a bool ndarray of the blank
+        cells or None when there are none
+    """
+    kind = column.dtype.kind
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories
+        if pd.api.types.infer_dtype(categories, skipna=False) == 'string':
+            codes = column.cat.codes.to_numpy()
+            writer = _coded_writer(worksheet, col, codes, categories, cell_format, row)
+            if writer is not None:
+                return writer
+            return (col, _write_method(worksheet, 'write_string'),
+                    np.asarray(categories, dtype=object)[codes].tolist(), cell_format, _blanks(codes < 0))
+
+    if kind == 'b':
+        return col, _write_method(worksheet, 'write_boolean'), column.tolist(), cell_format, \
+            _blanks(column.isna().to_numpy())
+
+    if kind == 'f':
+        return col, _write_method(worksheet, 'write_number'), column.tolist(), cell_format, \
+            _blanks(~np.isfinite(column.to_numpy(dtype=float, na_value=np.nan)))
+
+    if kind in 'iu':
+        return col, _write_method(worksheet, 'write_number'), column.tolist(), cell_format, \
+            _blanks(column.isna().to_numpy())
+
+    if kind == 'M':
+        serials = _excel_serials(column, worksheet.date_1904)
+        return col, _write_method(worksheet, 'write_number'), serials.tolist(), cell_format or date_format, \
+            _blanks(np.isnan(serials))
+
+    if pd.api.types.infer_dtype(column, skipna=True) == 'string':
+        if _coded(worksheet, row):
+            codes, labels = pd.factorize(column)
+            writer = _coded_writer(worksheet, col, codes, labels, cell_format, row)
+            if writer is not None:
+                return writer
+        return col, _write_method(worksheet, 'write_string'), column.tolist(), cell_format, \
+            _blanks(column.isna().to_numpy())
+
+    return col, _write_method(worksheet, 'write'), column.tolist(), cell_format, \
+        _blanks((column.isna() | column.isin([np.inf, -np.inf])).to_numpy())
+
+
+def _blanks(missing):
+    """ The mask of the blank cells of a column, None when nothing is missing.
+
+    :param missing: bool ndarray
+    :return: bool ndarray or None
+    """
+    return missing if missing.any() else None
+
+
+def _runs(missing, rows):
+    """ The runs of cells to write in a column, skipping the blank ones.
+
+    :param missing: bool ndarray or None
+    :param rows: int
+    :return: list, [start, stop] of each run
+    """
+    if missing is None:
+        return [[0, rows]] if rows else []
+
+    edges = np.flatnonzero(np.diff(np.concatenate([[True], missing, [True]]).astype(np.int8)))
+    return edges.reshape(-1, 2).tolist()
+
+
+def _coded(worksheet, row):
+    """ Whether strings can be written to the worksheet by their codes, see _coded_writer.
+
+    :param worksheet: Worksheet
+    :param row: int or None
+    :return: bool
+    """
+    return row is not None and not worksheet.constant_memory and _CellString is not None
+
+
+def _coded_writer(worksheet, col, codes, labels, cell_format=None, row=0):
+    """ Write a string column from its integer codes into the labels, -1 is a blank cell.
+
+    Each label used is looked up in the workbook's shared string table once, not once per cell, and its
+    cells share one cell tuple, so a label repeated across rows, charts and sheets is stored once. The
+    cells go straight into the worksheet table, the row and column bounds are checked for the whole
+    column up front. Constant memory mode writes inline strings row by row and isn't coded.
+
+    :param worksheet: Worksheet
+    :param col: int
+    :param codes: ndarray of int
+    :param labels: Index or ndarray of string
+    :param cell_format: Format, default None
+    :param row: int, default 0
+        The row of the first code.
+    :return: tuple, (col, write, values, cell_format, missing) like _column_writer, or None when the column
+        can't be written this way, e.g. out of the sheet or a string over Excel's limit.
+    """
+    if not _coded(worksheet, row):
+        return None
+
+    if len(codes) and (worksheet._check_dimensions(row, col) or worksheet._check_dimensions(row + len(codes) - 1,
+                                                                                         col)):
+        return None
+
+    present = codes[codes >= 0]
+    used = np.flatnonzero(np.bincount(present, minlength=len(labels)))
+    labels = np.asarray(labels, dtype=object)
+
+    if len(used) and max(len(labels[num]) for num in used) > worksheet.xls_strmax:
+        return None
+
+    str_table = worksheet.str_table
+    cells = np.empty(len(labels) + 1, dtype=object)
+    for num in used:
+        cells[num] = _CellString(str_table._get_shared_string_index(labels[num]), cell_format)
+    # One reference per cell like write_string, the lookups above counted one per label.
+    str_table.count += len(present) - len(used)
+
+    table = worksheet.table
+
+    def write(row, col, cell, cell_format):
+        table[row][col] = cell
+
+    return col, write, cells[codes].tolist(), cell_format, _blanks(codes < 0)
+
+
+def _excel_serials(column, date_1904=False):
+    """ Convert a datetime64 column, tz-aware or not, to Excel serial dates in one NumPy operation.
+
+    Timezone aware values keep their wall time, Excel has no timezones. Like xlsxwriter, serials after
+    1900-02-28 count Excel's 1900-02-29. NaT is NaN.
+
+    :param column: Series of datetime64
+    :param date_1904: bool, default False
+        The workbook uses the 1904 date system.
+    :return: ndarray of float
+    """
+    if column.dt.tz is not None:
+        column = column.dt.tz_localize(None)
+
+    values = column.to_numpy()
+
+    if date_1904:
+        return (values - np.datetime64('1904-01-01')) / np.timedelta64(1, 'D')
+
+    serials = (values - np.datetime64('1899-12-31')) / np.timedelta64(1, 'D')
+    return np.where(serials > 59, serials + 1, serials)
+
+
+def _write_method(worksheet, name):
+    """ Get the write method without the A1 notation decorator, it runs on every cell otherwise.
+
+    Newer xlsxwriter versions keep the undecorated method as `_write_*`, fall back to the public one.
+
+    :param worksheet: Worksheet
+    :param name: string, write write_number write_string write_datetime write_boolean
+    :return: method
+    """
+    return getattr(worksheet, '_' + name, None) or getattr(worksheet, name)
+
+
+class FormatCache(object):
+    """ Workbook level format cache.
+
+    Formats are keyed by their properties, so every distinct format is added to the workbook only once.
+    """
+    def __init__(self, workbook, instrument=None):
+        """
+
+        :param workbook: Workbook
+        :param instrument: _Instrument, default None
+            Counts the formats created.
+        :return:
+        """
+        self.workbook = workbook
+        self.instrument = _null_instrument if instrument is None else instrument
+        self._formats = {}
+
+    def get(self, properties):
+        """ Get the format for the properties, it is added to the workbook on first use.
+
+        :param properties: dict, e.g. {'bold': 1} or {'num_format': 'yyyy-mm-dd'}
+        :return: Format
+        """
+        key = tuple(sorted(properties.items()))
+        cell_format = self._formats.get(key)
+
+        if cell_format is None:
+            cell_format = self._formats[key] = self.workbook.add_format(properties)
+            self.instrument.count('formats')
+
+        return cell_format
+
+    def __len__(self):
+        return len(self._formats)
+
+
+class DataBlock(object):
+    """ The cells of a frame written to a worksheet, a header row followed by the data rows.
+
+    """
+    def __init__(self, sheet_name, first_row, first_col, rows, cols, blanks=0):
+        """
+
+        :param sheet_name: string
+        :param first_row: int, the header row
+        :param first_col: int, the categories column
+        :param rows: int, number of data rows
+        :param cols: int, number of columns
+        :param blanks: int, default 0
+            Number of data cells left blank for missing values.
+        :return:
+        """
+        self.sheet_name = sheet_name
+        self.first_row = first_row
+        self.first_col = first_col
+        self.rows = rows
+        self.cols = cols
+        self.blanks = blanks
+
+
+def _from_arrays(names, arrays):
+    """ A DataFrame on the arrays, NumPy arrays are wrapped without a copy.
+
+    :param names: list
+    :param arrays: list of array-like
+    :return: DataFrame
+    """
+    frame = pd.DataFrame(dict(enumerate(arrays)), copy=False)
+    frame.columns = list(names)
+    return frame
+
+
+def _index_frame(frame):
+    """ Prepend the index of the frame as its first column, without the copy of reset_index().
+
+    The levels of a MultiIndex are joined with ' / ' like the keys of an aggregate.
+
+    :param frame: DataFrame
+    :return: DataFrame
+    """
+    labels = frame.index
+    name = ' / '.join(str(name) for name in labels.names) if None not in labels.names else 'index'
+
+    if isinstance(labels, pd.MultiIndex):
+        labels = np.array([' / '.join(str(key) for key in label) for label in labels], dtype=object)
+    else:
+        labels = labels.array
+
+    return _from_arrays([name] + list(frame.columns),
+                        [labels] + [frame.iloc[:, num].array for num in range(frame.shape[1])])
+
+
+def _as_frame(data, columns=None, index=False):
+    """ Wrap columnar data in a DataFrame, numeric columns are read without a copy.
+
+    Accepts a DataFrame or Series, a 2-D or structured NumPy array, a dict of arrays, a pyarrow Table or
+    RecordBatch, a Polars DataFrame, any object with the DataFrame interchange protocol, or an iterable of
+    these as chunks. Arrow and Polars columns with nulls or several chunks are copied by their to_numpy().
+
+    :param data: columnar data
+    :param columns: list, default None
+        The header of a 2-D NumPy array, 0 to n - 1 when None. Renames the columns of other data.
+    :param index: bool, default False
+        Use the index of a DataFrame or Series as the categories column.
+    :return: DataFrame, or a generator of DataFrame for chunks
+    """
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+
+    if isinstance(data, pd.DataFrame):
+        frame = data
+    elif isinstance(data, np.ndarray):
+        if data.dtype.names:
+            frame = _from_arrays(data.dtype.names, [data[name] for name in data.dtype.names])
+        elif data.ndim == 2:
+            frame = pd.DataFrame(data, copy=False)
+        else:
+            raise ValueError('Expected a 2-D or structured array, got %d dimension(s).' % data.ndim)
+    elif isinstance(data, dict):
+        frame = _from_arrays(list(data), list(data.values()))
+    else:
+        kind = (type(data).__module__.split('.')[0], type(data).__name__)
+
+        if kind in (('pyarrow', 'Table'), ('pyarrow', 'RecordBatch')):
+            frame = _from_arrays(data.column_names, [data.column(num).to_numpy(zero_copy_only=False)
+                                                     for num in range(data.num_columns)])
+        elif kind == ('polars', 'DataFrame'):
+            frame = _from_arrays(data.columns, [data.get_column(name).to_numpy() for name in data.columns])
+        elif hasattr(data, '__dataframe__'):
+            frame = pd.api.interchange.from_dataframe(data)
+        elif hasattr(data, '__iter__') and not isinstance(data, (str, bytes)):
+            return (_as_frame(chunk, columns, index) for chunk in data)
+        else:
+            raise TypeError('Unsupported data of type %s.' % type(data).__name__)
+
+    if columns is not None:
+        frame = frame.set_axis(list(columns), axis=1)
+
+    if index:
+        frame = _index_frame(frame)
+
+    return frame
+
+
+def _write_frame(worksheet, frame, formats, first_row=0, first_col=0, date_parser=False):
+    """ Write the frame with its header to the worksheet.
+
+    The rows are written in order, so they can be flushed in constant memory mode, otherwise column by
+    column in runs of present values. Missing values are skipped and stay blank cells. An iterable of
+    DataFrame chunks, e.g. from pd.read_csv(..., chunksize=...), is written chunk by chunk.
+
+    :param worksheet: Worksheet
+    :param frame: DataFrame or iterable of DataFrame
+    :param formats: FormatCache
+    :param first_row: int, default 0
+    :param first_col: int, default 0
+    :param date_parser: bool, default False
+        Write the first column with the date format.
+    :return: DataBlock
+    """
+    chunks = iter([frame]) if isinstance(frame, pd.DataFrame) else iter(frame)
+
+    try:
+        first = next(chunks)
+    except StopIteration:
+        raise ValueError('No DataFrame chunks to write.')
+
+    columns = first.columns
+    cols = len(columns)
+    date_format = formats.get({'num_format': 'yyyy-mm-dd'})
+
+    worksheet.write_row(first_row, first_col, columns, formats.get({'bold': 1}))
+
+    row = first_row + 1
+    blanks = 0
+    for chunk in itertools.chain([first], chunks):
+        if not chunk.columns.equals(columns):
+            raise ValueError('Chunk columns %s do not match %s.' % (list(chunk.columns), list(columns)))
+
+        writers = [_column_writer(worksheet, first_col + col, chunk.iloc[:, col], date_format,
+                                  date_format if date_parser and col == 0 else None, row)
+                   for col in range(cols)]
+        blanks += sum(int(missing.sum()) for _, _, _, _, missing in writers if missing is not None)
+
+        if worksheet.constant_memory:
+            writers = [(col, write, values, cell_format, None if missing is None else missing.tolist())
+                       for col, write, values, cell_format, missing in writers]
+            for index in range(len(chunk)):
+                for col, write, values, cell_format, missing in writers:
+                    if missing is None or not missing[index]:
+                        write(row, col, values[index], cell_format)
+                row += 1
+            continue
+
+        for col, write, values, cell_format, missing in writers:
+            for start, stop in _runs(missing, len(chunk)):
+                for index, value in zip(range(row + start, row + stop), values[start:stop]):
+                    write(index, col, value, cell_format)
+        row += len(chunk)
+
+    return DataBlock(worksheet.name, first_row, first_col, row - first_row - 1, cols, blanks)
+
+
+def _write_block(instrument, worksheet, frame, formats, chart_type=None, **kwargs):
+    """ Write the frame with _write_frame in a 'write' span and count the cells written.
+
+    :param instrument: _Instrument
+    :param worksheet: Worksheet
+    :param frame: DataFrame or iterable of DataFrame
+    :param formats: FormatCache
+    :param chart_type: string, default None
+    :return: DataBlock
+    """
+    with instrument.span('write', worksheet.name, chart_type):
+        block = _write_frame(worksheet, frame, formats, **kwargs)
+    instrument.count('cells', (block.rows + 1) * block.cols - block.blanks, worksheet.name, chart_type)
+    instrument.count('blanks', block.blanks, worksheet.name, chart_type)
+
+    return block
+
+
+def _frame_key(frame, date_parser=False):
+    """ Content hash of a frame from its column names, dtypes and values.
+
+    :param frame: DataFrame
+    :param date_parser: bool, default False
+    :return: string
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((list(frame.columns), [str(dtype) for dtype in frame.dtypes], frame.shape,
+                        date_parser)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def _min_max_rows(values, max_points):
+    """ Row positions keeping the minimum and maximum of every series in each bucket.
+
+    The rows between the first and the last are split into equal buckets, the number of buckets is chosen so
+    that at most `max_points` rows are kept. Missing values are never picked unless a bucket has nothing else.
+    When `max_points` is too small for one bucket, 2 rows per series plus the first and the last, evenly
+    spaced rows are kept instead.
+
+    :param values: ndarray, 2-D float array of rows x series
+    :param max_points: int, at least 2
+    :return: ndarray, sorted row positions
+    """
+    if max_points < 2:
+        raise ValueError('max_points must be at least 2, the first and the last row are always kept, got %r.'
+                         % max_points)
+
+    rows, series = values.shape
+
+    if rows <= max_points:
+        return np.arange(rows)
+
+    inner = rows - 2
+    buckets = (max_points - 2) // (2 * max(series, 1))
+
+    if not buckets:
+        return np.unique(np.linspace(0, rows - 1, max_points).round().astype(np.int64))
+
+    size = -(-inner // buckets)
+    buckets = -(-inner // size)
+
+    padded = np.full((buckets * size, series), np.nan)
+    padded[:inner] = values[1:-1]
+    missing = np.isnan(padded)
+
+    low = np.where(missing, np.inf, padded).reshape(buckets, size, series).argmin(axis=1)
+    high = np.where(missing, -np.inf, padded).reshape(buckets, size, series).argmax(axis=1)
+    starts = (np.arange(buckets) * size + 1)[:, None]
+
+    picked = np.concatenate([(starts + low).ravel(), (starts + high).ravel()])
+    return np.unique(np.concatenate([[0, rows - 1], np.minimum(picked, rows - 2)]))
+
+
+def _downsample(frame, max_points):
+    """ Reduce the rows of a frame whose first column is x and the others are series.
+
+    :param frame: DataFrame
+    :param max_points: int
+    :return: DataFrame
+    """
+    values = frame.iloc[:, 1:].to_numpy(dtype=float, na_value=np.nan)
+    return frame.take(_min_max_rows(values, max_points))
+
+
+# Series per chart, Excel doesn't open a chart with more.
+_MAX_SERIES = 255
+
+
+def _rank_series(frame, top_n, rank='variance'):
+    """ Keep the first column and the top N series columns by a score, in their order in the frame.
+
+    The scores of all columns are computed in one pass over the values, missing values are ignored and a
+    series without any value ranks last.
+
+    :param frame: DataFrame
+    :param top_n: int
+    :param rank: string, variance last total, default 'variance'
+    :return: DataFrame
+    """
+    values = frame.iloc[:, 1:].to_numpy(dtype=float, na_value=np.nan)
+    present = ~np.isnan(values)
+    counts = present.sum(axis=0)
+    filled = np.where(present, values, 0.)
+
+    if rank == 'variance':
+        means = filled.sum(axis=0) / np.maximum(counts, 1)
+        scores = (np.where(present, values - means, 0.) ** 2).sum(axis=0) / np.maximum(counts, 1)
+    elif rank == 'last':
+        if len(values):
+            last = len(values) - 1 - present[::-1].argmax(axis=0)
+            scores = values[last, np.arange(values.shape[1])]
+        else:
+            scores = filled.sum(axis=0)
+    elif rank == 'total':
+        scores = filled.sum(axis=0)
+    else:
+        raise ValueError('Unknown rank %r, use variance last or total.' % rank)
+
+    scores = np.where(counts > 0, scores, -np.inf)
+    keep = np.sort(np.argsort(-scores, kind='stable')[:top_n])
+
+    return frame.iloc[:, np.concatenate([[0], keep + 1])]
+
+
+def _plan_series(frame, wide=None):
+    """ Fit the series of a frame in charts of at most 255 series, before anything is written.
+
+    Only the first chunk of an iterable of chunks is read to count the series, unless they are ranked.
+
+    :param frame: DataFrame or iterable of DataFrame
+    :param wide: dict, default None
+        {'split': int} or {'top_n': int, 'rank': string}, see ExcelChart.column().
+    :return: tuple, (frame, list of ranges of the series columns of each chart)
+    """
+    wide = dict(wide or {})
+    unknown = sorted(set(wide) - {'split', 'top_n', 'rank'})
+
+    if unknown or (wide and ('split' in wide) == ('top_n' in wide)):
+        raise ValueError("Expected wide={'split': n} or wide={'top_n': n, 'rank': ...}, got %r." % wide)
+
+    if not isinstance(frame, pd.DataFrame):
+        if 'top_n' in wide:
+            frame = pd.concat(frame, ignore_index=True)
+        else:
+            chunks = iter(frame)
+            try:
+                first = next(chunks)
+            except StopIteration:
+                raise ValueError('No DataFrame chunks to write.')
+            frame = itertools.chain([first], chunks)
+            cols = first.shape[1]
+
+    if 'top_n' in wide:
+        if not 0 < wide['top_n'] <= _MAX_SERIES:
+            raise ValueError('top_n must be 1 to %d, got %r.' % (_MAX_SERIES, wide['top_n']))
+        frame = _rank_series(frame, wide['top_n'], wide.get('rank', 'variance'))
+
+    if isinstance(frame, pd.DataFrame):
+        cols = frame.shape[1]
+
+    size = wide.get('split', _MAX_SERIES)
+
+    if not 0 < size <= _MAX_SERIES:
+        raise ValueError('split must be 1 to %d series per chart, got %r.' % (_MAX_SERIES, size))
+
+    if cols - 1 > size and 'split' not in wide:
+        raise ValueError('The frame has %d series, an Excel chart takes at most %d. Split them with '
+                         "wide={'split': %d} or keep the top N with wide={'top_n': n, 'rank': 'variance'}."
+                         % (cols - 1, _MAX_SERIES, _MAX_SERIES))
+
+    return frame, [range(start, min(start + size, cols)) for start in range(1, cols, size)] or [range(1, cols)]
+
+
+def _pivot(frame, x, series, values):
+    """ Pivot long data, one row per x, series and value, to a column of values per series.
+
+    A frame sorted by x with the same series in the same order under every x is reshaped, nothing is
+    hashed. Otherwise x and the series are factorized once and the values scattered into place. The
+    values stay one 2-D float array, the columns of the result are views of it. A missing pair is NaN,
+    a blank cell.
+
+    :param frame: DataFrame or iterable of DataFrame
+    :param x: string, the categories column
+    :param series: string, the column of series names
+    :param values: string, the values column
+    :return: DataFrame, x followed by a column per series in the order they first appear, x is sorted
+    """
+    if x is None or series is None or values is None:
+        raise ValueError('Pivoting long data needs the x, series and values columns, got x=%r, series=%r, values=%r.'
+                         % (x, series, values))
+
+    if not isinstance(frame, pd.DataFrame):
+        frame = pd.concat(frame, ignore_index=True)
+
+    keys = frame[x]
+    labels = frame[series]
+    numbers = frame[values].to_numpy(dtype=float, na_value=np.nan)
+
+    if len(frame) and keys.is_monotonic_increasing and not labels.isna().any():
+        width = int(np.argmax((keys != keys.iloc[0]).to_numpy())) or len(frame)
+        # Sorted keys are equal over a row of the grid when its first and last are.
+        firsts, lasts = keys.iloc[::width].to_numpy(), keys.iloc[width - 1::width].to_numpy()
+
+        if len(frame) % width == 0 and (firsts == lasts).all() and (firsts[1:] != firsts[:-1]).all() and \
+                labels.iloc[:width].is_unique and (labels == labels.shift(width)).iloc[width:].all():
+            matrix = numbers.reshape(-1, width)
+            return _from_arrays([x] + labels.iloc[:width].tolist(), [firsts] + [matrix[:, num] for num in range(width)])
+
+    x_codes, x_labels = pd.factorize(keys, sort=True)
+    codes, names = pd.factorize(labels)
+    keep = (x_codes >= 0) & (codes >= 0)
+    cells = x_codes[keep] * len(names) + codes[keep]
+
+    if len(cells) and np.bincount(cells).max() > 1:
+        raise ValueError('Some (%s, %s) pairs have several rows, aggregate them before passing the frame, e.g. '
+                         'frame.groupby([%r, %r], as_index=False)[%r].sum().' % (x, series, x, series, values))
+
+    matrix = np.full(len(x_labels) * len(names), np.nan)
+    matrix[cells] = numbers[keep]
+    matrix = matrix.reshape(len(x_labels), len(names))
+
+    return _from_arrays([x] + list(names), [np.asarray(x_labels)] + [matrix[:, num] for num in range(len(names))])
+
+
+def _prepare_frame(frame, columns=None, index=False, x=None, series=None, values=None, aggregate=None, wide=None):
+    """ The frame of a builder, pivoted and aggregated, and its series split into the parts of the charts.
+
+    See ExcelChart.column() for the arguments.
+
+    :param frame: any data the builders accept
+    :param columns: list, default None
+    :param index: bool, default False
+    :param x: string, default None
+    :param series: string, default None
+    :param values: string, default None
+    :param aggregate: dict, default None
+    :param wide: dict, default None
+    :return: tuple, (DataFrame or iterable of DataFrame, list of range)
+    """
+    frame = _as_frame(frame, columns, index)
+
+    if x is not None or series is not None or values is not None:
+        frame = _pivot(frame, x, series, values)
+
+    if aggregate:
+        frame = _aggregate(frame, **aggregate)
+
+    return _plan_series(frame, wide)
+
+
+def _facets(frame, keys):
+    """ Sort a long frame by its keys once and find the contiguous rows of each group.
+
+    A frame already in key order is sliced, not reordered. Rows with a missing key are left out.
+
+    :param frame: DataFrame
+    :param keys: list, the key columns
+    :return: tuple, (the other columns in key order, list of group labels, list of (start, stop) rows)
+    """
+    # Missing keys have no group, NaN.
+    codes = frame.groupby(keys, sort=True).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    others = [num for num, name in enumerate(frame.columns) if name not in keys]
+    skip = int((codes < 0).sum())
+
+    if (codes[1:] >= codes[:-1]).all():
+        positions = np.arange(skip, len(codes))
+        data = frame.iloc[skip:, others]
+    else:
+        positions = np.argsort(codes, kind='stable')[skip:]
+        data = frame.iloc[positions, others]
+
+    counts = np.bincount(codes[positions], minlength=codes.max(initial=-1) + 1)
+    stops = np.cumsum(counts)
+    starts = stops - counts
+
+    firsts = frame.iloc[positions[starts], [frame.columns.get_loc(key) for key in keys]]
+    labels = [' / '.join(str(value) for value in row) for row in firsts.itertuples(index=False)]
+
+    return data, labels, list(zip(starts.tolist(), stops.tolist()))
+
+
+def _aggregate(frame, by, func='sum', top_n=None, other='Other'):
+    """ Group the frame by the keys and reduce the other columns, keeping the top N groups.
+
+    Sums and counts are taken in one groupby pass, DataFrame chunks are reduced one by one and combined.
+    Groups are ranked by the total of their reduced values, the remaining groups are folded into one row.
+    The columns other than the keys must be numeric.
+
+    :param frame: DataFrame or iterable of DataFrame
+    :param by: string or list, the group-by keys
+    :param func: string or dict, sum mean count, or a dict of column -> reducer, default 'sum'
+    :param top_n: int, default None
+    :param other: string, the label of the folded row, default 'Other'
+    :return: DataFrame, the categories column followed by the reduced columns
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    chunks = [frame] if isinstance(frame, pd.DataFrame) else frame
+
+    def group(chunk):
+        for name, column in chunk.items():
+            if name not in keys and not pd.api.types.is_numeric_dtype(column):
+                raise ValueError('Cannot aggregate the column %r of dtype %s, only numeric columns are reduced. '
+                                 'Drop it or add it to the keys.' % (name, column.dtype))
+        return chunk.groupby(keys, sort=False, observed=True).agg(['sum', 'count'])
+
+    parts = [group(chunk) for chunk in chunks]
+    if not parts:
+        raise ValueError('No DataFrame chunks to aggregate.')
+
+    table = parts[0]
+    if len(parts) > 1:
+        table = pd.concat(parts).groupby(level=list(range(len(keys))), sort=False).sum()
+
+    columns = table.columns.get_level_values(0).unique().tolist()
+    funcs = func if isinstance(func, dict) else dict.fromkeys(columns, func)
+    sums = table.xs('sum', axis=1, level=1).to_numpy(dtype=float)
+    counts = table.xs('count', axis=1, level=1).to_numpy(dtype=float)
+
+    def reduce(group_sums, group_counts):
+        reduced = np.empty_like(group_sums)
+        for num, col in enumerate(columns):
+            reducer = funcs.get(col, 'sum')
+            if reducer == 'sum':
+                reduced[:, num] = group_sums[:, num]
+            elif reducer == 'count':
+                reduced[:, num] = group_counts[:, num]
+            elif reducer == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    reduced[:, num] = group_sums[:, num] / group_counts[:, num]
+            else:
+                raise ValueError('Unknown reducer %r for column %r, use sum mean or count.' % (reducer, col))
+        return reduced
+
+    values = reduce(sums, counts)
+    labels = table.index.tolist()
+    if len(keys) > 1:
+        labels = [' / '.join(str(key) for key in label) for label in labels]
+
+    if top_n is not None and top_n < len(labels):
+        totals = np.nansum(values, axis=1)
+        keep = np.argpartition(-totals, top_n - 1)[:top_n] if top_n > 0 else np.arange(0)
+        keep = keep[np.argsort(-totals[keep], kind='stable')]
+        rest = np.ones(len(labels), dtype=bool)
+        rest[keep] = False
+
+        values = np.vstack([values[keep], reduce(sums[rest].sum(axis=0, keepdims=True),
+                                                 counts[rest].sum(axis=0, keepdims=True))])
+        labels = [labels[row] for row in keep] + [other]
+
+    result = pd.DataFrame(values, columns=columns)
+    result.insert(0, ' / '.join(str(key) for key in keys), labels)
+
+    return result
 
 
 class Chart(object):
     """ The chart of class.
 
     """
-    def __init__(self, workbook, frame, sheet_name=None, chart_type=None, subtype=None, date_parser=False):
+    def __init__(self, workbook, frame, sheet_name=None, chart_type=None, subtype=None, date_parser=False,
+                 formats=None, block=None, instrument=None, worksheet=None, series=None, rows=None):
         """
 
-        :param workbook: string
-        :param frame: DataFrame
+        :param workbook: Workbook
+        :param frame: DataFrame or iterable of DataFrame chunks
         :param sheet_name: string, default None
         :param chart_type: string, default None
         :param subtype: string, default None
         :param date_parser: bool, default False
+        :param formats: FormatCache, default None
+            The workbook's shared format cache, a private one is created when None.
+        :param block: DataBlock, default None
+            Where the frame is already written, the frame is written to the chart's worksheet when None.
+        :param instrument: _Instrument, default None
+            Receives the spans and counters of the chart.
+        :param worksheet: Worksheet, default None
+            Place the chart on this worksheet, e.g. a grid sheet, a new worksheet is added when None.
+        :param series: range, default None
+            The columns of the block plotted as series, all but the first when None.
+        :param rows: tuple, default None
+            (start, stop) of the data rows of the block plotted, counted from 0 like a slice, all when None.
         :return:
         """
         self.workbook = workbook
+        self.instrument = _null_instrument if instrument is None else instrument
+        self.formats = FormatCache(workbook, self.instrument) if formats is None else formats
         self.frame = frame
         self.sheet_name = sheet_name
         self.chart_type = chart_type
         self.subtype = subtype
 
         self.uppercase = string.ascii_uppercase
-        self.data = frame.values
-        self.shape = frame.shape
 
-        self.bold = workbook.add_format({'bold': 1})
-        self.date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        self.bold = self.formats.get({'bold': 1})
+        self.date_format = self.formats.get({'num_format': 'yyyy-mm-dd'})
 
         # Create a workbook and write the data.
-        self.worksheet = self.workbook.add_worksheet(sheet_name)
+        self.worksheet = self.workbook.add_worksheet(sheet_name) if worksheet is None else worksheet
+
+        # Where save() inserts the chart, a grid sets the offsets.
+        self.anchor = 'D4'
+        self.anchor_options = None
 
         # x_
         self.x_axis_params = {}
         self.y_axis_params = {}
 
-        if sheet_name is None:
+        if sheet_name is None or worksheet is not None:
             self.sheet_name = self.worksheet.name
 
         # Write data to worksheet.
-        self.worksheet.write_row('A1', self.frame.columns, self.bold)
+        if block is None:
+            block = _write_block(self.instrument, self.worksheet, frame, self.formats, chart_type,
+                                 date_parser=date_parser)
 
-        for col in range(self.shape[1]):
-            self.worksheet.write_column(1, col, self.data[:, col],
-                                        self.date_format if date_parser and col == 0 else None)
+        self.block = block
+        self.shape = (block.rows, block.cols)
+        self.series = range(1, block.cols) if series is None else series
+        self.rows = (0, block.rows) if rows is None else rows
 
         # Create a Chart object.
         self.chart = self.workbook.add_chart({'type': chart_type, 'subtype': subtype})
 
+        # Missing values are blank cells, show them as gaps, not zeros, unless the style says otherwise.
+        if block.blanks:
+            self.show_blanks_as('gap')
+
     def add_series(self, data_labels, overlap=0, gap=150):
         """ Add one or more data series.
 
@@ -69,16 +996,23 @@ class Chart(object):
         :return:
         """
 
-        for num in range(1, self.shape[1]):
-            '[sheet_name, first_row, first_col, last_row, last_col]'
-            self.chart.add_series({
-                'name': [self.sheet_name, 0, num, 0, num],
-                'categories': [self.sheet_name, 1, 0, self.shape[0], 0],
-                'values': [self.sheet_name, 1, num, self.shape[0], num],
-                'data_labels': {'value': data_labels},
-                'overlap': overlap,
-                'gap': gap
-            })
+        block = self.block
+        first_row = block.first_row + 1 + self.rows[0]
+        last_row = block.first_row + self.rows[1]
+
+        with self.instrument.span('series', self.sheet_name, self.chart_type):
+            for num in self.series:
+                '[sheet_name, first_row, first_col, last_row, last_col]'
+                col = block.first_col + num
+                self.chart.add_series({
+                    'name': [block.sheet_name, block.first_row, col, block.first_row, col],
+                    'categories': [block.sheet_name, first_row, block.first_col, last_row, block.first_col],
+                    'values': [block.sheet_name, first_row, col, last_row, col],
+                    'data_labels': {'value': data_labels},
+                    'overlap': overlap,
+                    'gap': gap
+                })
+        self.instrument.count('series', len(self.series), self.sheet_name, self.chart_type)
 
     def set_size(self, width=480, height=350, x_scale=1, y_scale=1, x_offset=0, y_offset=0):
         """ Set the dimensions of the chart.
@@ -883,100 +1817,659 @@ class Chart(object):
         :param chart_sheet:
         :return:
         """
-        self.chart.set_x_axis(self.x_axis_params)
-        self.chart.set_y_axis(self.y_axis_params)
-        if chart_sheet:
-            chart_sheets = self.workbook.add__chartsheet(chart_sheet)
-            chart_sheets.set_chart(self.chart)
-        else:
-            self.worksheet.insert_chart('D4', self.chart)
+        with self.instrument.span('chart_save', self.sheet_name, self.chart_type):
+            self.chart.set_x_axis(self.x_axis_params)
+            self.chart.set_y_axis(self.y_axis_params)
+            if chart_sheet:
+                chart_sheets = self.workbook.add__chartsheet(chart_sheet)
+                chart_sheets.set_chart(self.chart)
+            else:
+                self.worksheet.insert_chart(self.anchor, self.chart, self.anchor_options)
 
 
-class ExcelChart(object):
-    """ Excel Chart Class.
+def _style_axes(chart, data_labels=False, overlap=0, gap=150, title=None, font='Arial', legend=None, x_grid=False,
+                y_grid=False, x_limit=None, y_limit=None, x_title=None, y_title=None, x_reverse=False, y_reverse=False,
+                table=False, size=None):
+    """ Add the series and set the options of a chart with x and y axes.
+
+    Used by the column, bar, line, scatter, area and stock charts, see ExcelChart.column() for the parameters.
 
+    :return:
     """
-    def __init__(self, filename):
-        """
+    chart.add_series(data_labels=data_labels, overlap=overlap, gap=gap)
 
-        :param filename: string
-        :return:
-        """
-        self._filename = filename
-        self._workbook = xlsxwriter.Workbook(self._filename)
-        self._bold = self._workbook.add_format({'bold': 1})
-        self._date_format = self._workbook.add_format({'num_format': 'yyyy-mm-dd'})
-        self._charts = []
+    chart.set_title(title=title, font=font)
+    chart.set_legend(legend=legend)
+    chart.set_x_grid(major=x_grid, minor=False)
+    chart.set_y_grid(major=y_grid, minor=False)
+    chart.set_x_limit(limit=x_limit)
+    chart.set_y_limit(limit=y_limit)
 
-    def column(self, frame, sheet_name=None, subtype=None, data_labels=False, overlap=0, gap=150, title=None,
-               font='Arial', legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None,
-               y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None
-               ):
-        """ Create a Column chart.
+    if x_title:
+        chart.set_x_title(title=x_title, font=font)
 
-        :param frame: DataFrame
-        :param sheet_name: string, default None
-        :param subtype: string, stacked percent_stacked, default None
-        :param data_labels: bool, default False
-        :param overlap: int, default 0
-        :param gap: int, default 150
-        :param title: string, default None
-        :param font: string, default 'Arial'
-        :param legend: string, default None
-        :param x_grid: bool, default False
-        :param y_grid: bool, default False
-        :param x_limit: tuple, default None
-        :param y_limit: tuple, default None
-        :param x_title: string, default None
-        :param y_title: string, default None
-        :param x_reverse: bool, default False
-        :param y_reverse: bool, default False
-        :param table: bool, default, False
-        :param size: tuple, default None
-        :param chart_sheet: string, default None
-        :return:
-        """
+    if y_title:
+        chart.set_y_title(title=y_title, font=font)
 
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='column', subtype=subtype)
+    if x_reverse:
+        chart.set_x_reverse()
 
-        chart.add_series(data_labels=data_labels, overlap=overlap, gap=gap)
+    if y_reverse:
+        chart.set_y_reverse()
 
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend)
-        chart.set_x_grid(major=x_grid, minor=False)
-        chart.set_y_grid(major=y_grid, minor=False)
-        chart.set_x_limit(limit=x_limit)
-        chart.set_y_limit(limit=y_limit)
+    if table:
+        chart.set_table(font=font)
 
-        if x_title:
-            chart.set_x_title(title=x_title, font=font)
+    if size:
+        chart.set_size(width=size[0], height=size[1])
 
-        if y_title:
-            chart.set_y_title(title=y_title, font=font)
 
-        if x_reverse:
-            chart.set_x_reverse()
+def _style_pie(chart, data_labels=False, title=None, font='Arial', legend=None, rotation=0, size=None):
+    """ Add the series and set the options of a pie or doughnut chart, see ExcelChart.pie() for the parameters.
 
-        if y_reverse:
-            chart.set_y_reverse()
+    :return:
+    """
+    chart.add_series(data_labels=data_labels)
+    chart.set_title(title=title, font=font)
+    chart.set_legend(legend=legend, font=font)
+    chart.set_rotation(rotation)
 
-        if table:
-            chart.set_table(font=font)
+    if size:
+        chart.set_size(width=size[0], height=size[1])
 
-        if size:
-            chart.set_size(width=size[0], height=size[1])
 
-        self._charts.append((chart, chart_sheet))
+def _style_radar(chart, data_labels=False, title=None, font='Arial', legend=None, major_grid=True, minor_grid=False,
+                 size=None):
+    """ Add the series and set the options of a radar chart, see ExcelChart.radar() for the parameters.
 
-        return chart
+    :return:
+    """
+    chart.add_series(data_labels=data_labels)
+    chart.set_title(title=title, font=font)
+    chart.set_legend(legend=legend, font=font)
+    chart.set_y_grid(major=major_grid, minor=minor_grid)
 
-    def bar(self, frame, sheet_name=None, subtype=None, data_labels=False, overlap=0, gap=150, title=None,
-            font='Arial', legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None,
-            y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None
-            ):
-        """ Create a Bar chart.
+    if size:
+        chart.set_size(width=size[0], height=size[1])
+
+
+class _CallRecorder(object):
+    """ Stand-in for an xlsxwriter chart, it records the method calls and their payloads.
+
+    """
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.calls.append((name, args))
+
+        return record
+
+
+class _ChartRecorder(Chart):
+    """ Stand-in Chart without a workbook or data, the set_* methods build their payloads as usual.
+
+    """
+    def __init__(self):
+        self.calls = []
+        self.series = {}
+        self.chart = _CallRecorder(self.calls)
+        self.x_axis_params = {}
+        self.y_axis_params = {}
+
+    def add_series(self, **kwargs):
+        self.series = kwargs
+
+
+class _LazyChart(object):
+    """ The chart returned by a builder of a lazy ExcelChart.
+
+    Its method calls are recorded and replayed on the real Chart when save() builds it, after that it
+    forwards to the real Chart.
+    """
+    def __init__(self):
+        self._calls = []
+        self._chart = None
+
+    def __getattr__(self, name):
+        if self._chart is not None:
+            return getattr(self._chart, name)
+
+        if name.startswith('_') or not callable(getattr(Chart, name, None)):
+            raise AttributeError('%r is available once ExcelChart.save() has built the chart.' % name)
+
+        def record(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+
+        return record
+
+    def _materialise(self, chart):
+        """ Replay the recorded calls on the chart built by save().
+
+        :param chart: Chart
+        :return:
+        """
+        for name, args, kwargs in self._calls:
+            getattr(chart, name)(*args, **kwargs)
+
+        self._chart = chart
+        self._calls = []
+
+
+class _ChartGroup(object):
+    """ Charts built together, a wide frame split by the builders with wide={'split': n} or the groups of facet().
+
+    Chart methods are called on every chart of the group, other attributes are those of the first chart.
+    """
+    def __init__(self, charts):
+        """
+
+        :param charts: list of Chart
+        :return:
+        """
+        self.charts = charts
+
+    def __getattr__(self, name):
+        if not callable(getattr(Chart, name, None)):
+            return getattr(self.charts[0], name)
+
+        def forward(*args, **kwargs):
+            for chart in self.charts:
+                getattr(chart, name)(*args, **kwargs)
+
+        return forward
+
+    def save(self, chart_sheet=None):
+        """ Save every chart, the chart sheets are numbered after the first one.
+
+        :param chart_sheet: string, default None
+        :return:
+        """
+        for num, chart in enumerate(self.charts):
+            chart.save(_part_name(chart_sheet, num))
+
+
+def _part_name(name, num):
+    """ The sheet name of the num-th chart of a group, 'name (2)' from the second on, None stays None.
+
+    :param name: string or None
+    :param num: int
+    :return: string or None
+    """
+    if name is None or num == 0:
+        return name
+
+    suffix = ' (%d)' % (num + 1)
+    return name[:31 - len(suffix)] + suffix
+
+
+def _deferrable(builder):
+    """ Record the calls of a builder as a plan when the ExcelChart is lazy.
+
+    :param builder: function
+    :return: function
+    """
+    @functools.wraps(builder)
+    def build(self, *args, **kwargs):
+        if not self._lazy:
+            return builder(self, *args, **kwargs)
+
+        chart = _LazyChart()
+        self._plans.append((builder, args, kwargs, chart))
+        return chart
+
+    return build
+
+
+class ChartSpec(object):
+    """ A chart layout compiled once and applied to any number of frames.
+
+    The options are the builder's arguments, e.g. ChartSpec('column', title='Sales', legend='top'). They are
+    validated and compiled into the xlsxwriter option payloads once, applying the spec to a frame only adds the
+    series ranges. See ExcelChart.apply().
+    """
+    styles = {'column': _style_axes, 'bar': _style_axes, 'line': _style_axes, 'scatter': _style_axes,
+              'area': _style_axes, 'stock': _style_axes, 'pie': _style_pie, 'doughnut': _style_pie,
+              'radar': _style_radar}
+    subtypes = ('column', 'bar', 'radar', 'scatter', 'area')
+
+    def __init__(self, kind, subtype=None, **options):
+        """
+
+        :param kind: string, column bar line pie radar scatter area doughnut stock
+        :param subtype: string, default None
+        :param options: the arguments of the builder, without the frame and sheet names
+        :return:
+        """
+        if kind not in self.styles:
+            raise ValueError('Unknown chart kind %r, use one of %s.' % (kind, ', '.join(sorted(self.styles))))
+
+        if subtype and kind not in self.subtypes:
+            raise ValueError('A %s chart has no subtype.' % kind)
+
+        style = self.styles[kind]
+        allowed = [name for name in inspect.signature(style).parameters if name != 'chart']
+        unknown = sorted(set(options) - set(allowed))
+
+        if unknown:
+            raise ValueError('Unknown options %s for a %s chart, use %s.' % (unknown, kind, ', '.join(allowed)))
+
+        self.kind = kind
+        self.subtype = subtype
+        self.options = options
+
+        recorder = _ChartRecorder()
+        style(recorder, **options)
+
+        self._series = recorder.series
+        self._calls = recorder.calls
+        self._x_axis_params = recorder.x_axis_params
+        self._y_axis_params = recorder.y_axis_params
+
+    @classmethod
+    def from_dict(cls, spec):
+        """ Create a spec from a dict with a 'kind' key and the builder options.
+
+        :param spec: dict
+        :return: ChartSpec
+        """
+        return cls(**spec)
+
+    @classmethod
+    def from_json(cls, text):
+        """ Create a spec from a JSON object, see from_dict().
+
+        :param text: string
+        :return: ChartSpec
+        """
+        return cls.from_dict(json.loads(text))
+
+    def to_dict(self):
+        """ The spec as a dict, from_dict() creates the same spec from it.
+
+        :return: dict
+        """
+        spec = dict(self.options, kind=self.kind)
+
+        if self.subtype:
+            spec['subtype'] = self.subtype
+
+        return spec
+
+    def apply(self, chart):
+        """ Add the series to a chart and set the compiled options.
+
+        :param chart: Chart
+        :return:
+        """
+        chart.add_series(**self._series)
+
+        for name, args in self._calls:
+            getattr(chart.chart, name)(*args)
+
+        chart.x_axis_params.update(self._x_axis_params)
+        chart.y_axis_params.update(self._y_axis_params)
+
+
+class _ZipFile(zipfile.ZipFile):
+    """ The ZipFile of xlsxwriter, using the compression of the _Workbook that is being stored.
+
+    xlsxwriter always deflates at the default level. Outside _Workbook._store_workbook() this is a plain ZipFile.
+    """
+    def __init__(self, file, mode='r', compression=zipfile.ZIP_STORED, allowZip64=True, compresslevel=None,
+                 **kwargs):
+        options = _zip_options.get()
+        if options is not None:
+            compression, compresslevel = options
+
+        zipfile.ZipFile.__init__(self, file, mode, compression, allowZip64, compresslevel, **kwargs)
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        # A ZipInfo doesn't take the level of the archive, xlsxwriter passes one in memory mode.
+        if compresslevel is None:
+            compresslevel = self.compresslevel
+
+        zipfile.ZipFile.writestr(self, zinfo_or_arcname, data, compress_type, compresslevel)
+
+
+class _Workbook(xlsxwriter.Workbook):
+    """ An xlsxwriter Workbook with a configurable zip compression.
+
+    xlsxwriter opens its zip file through the module global ZipFile, it is swapped for _ZipFile while any
+    _Workbook is being stored and put back when the last store ends.
+    """
+    _zip_lock = threading.Lock()
+    _zip_stores = 0
+    _zip_original = None
+
+    def __init__(self, filename=None, options=None, compression=None):
+        """
+
+        :param filename: string or file-like object, default None
+        :param options: dict, default None
+            The xlsxwriter Workbook options.
+        :param compression: int, default None
+            zlib level 1 to 9, 0 stores the parts uncompressed, xlsxwriter's default level when None.
+        :return:
+        """
+        if compression is not None and (isinstance(compression, bool) or not isinstance(compression, numbers.Integral)
+                                        or not 0 <= compression <= 9):
+            raise ValueError('Unknown compression %r, use 0 to store or a zlib level 1 to 9.' % (compression,))
+
+        xlsxwriter.Workbook.__init__(self, filename, options)
+        self.compression = None if compression is None else int(compression)
+
+    def _store_workbook(self):
+        if self.compression is None:
+            return xlsxwriter.Workbook._store_workbook(self)
+
+        with _Workbook._zip_lock:
+            if not _Workbook._zip_stores:
+                _Workbook._zip_original = xlsxwriter.workbook.ZipFile
+                xlsxwriter.workbook.ZipFile = _ZipFile
+            _Workbook._zip_stores += 1
+
+        token = _zip_options.set((zipfile.ZIP_STORED, None) if self.compression == 0 else
+                                 (zipfile.ZIP_DEFLATED, self.compression))
+        try:
+            return xlsxwriter.Workbook._store_workbook(self)
+        finally:
+            _zip_options.reset(token)
+
+            with _Workbook._zip_lock:
+                _Workbook._zip_stores -= 1
+                if not _Workbook._zip_stores:
+                    xlsxwriter.workbook.ZipFile = _Workbook._zip_original
+
+
+class _Grid(object):
+    """ Charts placed on one worksheet, `cols` charts per row.
+
+    """
+    def __init__(self, worksheet, cols, gap, data_sheet):
+        """
+
+        :param worksheet: Worksheet
+        :param cols: int
+        :param gap: int, pixels around the charts
+        :param data_sheet: string, where the data of the charts is written
+        :return:
+        """
+        self.worksheet = worksheet
+        self.cols = cols
+        self.gap = gap
+        self.data_sheet = data_sheet
+        self.charts = []
+
+    def place(self):
+        """ Anchor all charts in one pass from their set_size dimensions.
+
+        A grid column is as wide as its widest chart and a row as high as its tallest chart. The charts are
+        anchored at A1 with pixel offsets, their own set_size offsets are added to them.
+
+        :return:
+        """
+        sizes = [(int(0.5 + chart.chart.width * chart.chart.x_scale),
+                  int(0.5 + chart.chart.height * chart.chart.y_scale)) for chart in self.charts]
+        widths = [0] * self.cols
+        heights = [0] * -(-len(sizes) // self.cols)
+
+        for num, (width, height) in enumerate(sizes):
+            row, col = divmod(num, self.cols)
+            widths[col] = max(widths[col], width)
+            heights[row] = max(heights[row], height)
+
+        xs = list(itertools.accumulate([self.gap] + [width + self.gap for width in widths]))
+        ys = list(itertools.accumulate([self.gap] + [height + self.gap for height in heights]))
+
+        for num, chart in enumerate(self.charts):
+            row, col = divmod(num, self.cols)
+            own = chart.chart.x_offset or 0, chart.chart.y_offset or 0
+            # A chart's own offsets would replace the grid offsets in insert_chart().
+            chart.chart.x_offset = chart.chart.y_offset = 0
+            chart.anchor = 'A1'
+            chart.anchor_options = {'x_offset': xs[col] + own[0], 'y_offset': ys[row] + own[1]}
+
+
+class ExcelChart(object):
+    """ Excel Chart Class.
+
+    """
+    def __init__(self, filename=None, streaming=False, data_sheet=None, executor=None, output=None, hook=None,
+                 lazy=False, compression=None, zip64=False, tmpdir=None):
+        """
+
+        :param filename: string or file-like object, default None
+            A file-like object, e.g. BytesIO, is written in memory without temporary files.
+        :param streaming: bool, default False
+            Use xlsxwriter constant memory mode, each row is flushed to disk once the next row is written.
+        :param data_sheet: string, default None
+            Write the data of all charts to this worksheet, identical frames are written once and shared
+            by their charts. Each chart writes its data to its own worksheet when None.
+        :param executor: Executor, default None
+            Where the async methods run, a thread pool with one thread per CPU shared by all workbooks when
+            None. Its number of workers bounds how many workbooks are built or saved at once. The workbook
+            lives in this process, so it must be a thread based executor.
+        :param output: string, default None
+            'bytes' builds the workbook in memory and save() returns it as bytes, without a `filename`.
+            Streaming still spills rows to temporary files, xlsxwriter can't combine it with in memory mode.
+        :param hook: callable, default None
+            Called with a dict for every timed span and counter, e.g. log_event. The hook set by instrument()
+            is used when None, without any hook nothing is measured.
+            Spans: 'write' the data, 'options' the set_* calls of a builder, 'series' add_series,
+            'chart_save' Chart.save and 'close' Workbook.close. Counters: 'cells' written, 'blanks' left for
+            missing values, 'formats' created and 'series' added. Events carry the 'sheet' and 'chart_type'
+            they belong to, None for the workbook.
+        :param lazy: bool, default False
+            The builders only record a plan with the frame and return a stand-in chart that records its
+            set_* calls. save() builds all charts in one pass in the order they are planned, and discard()
+            drops a planned chart. The frames must not change before save().
+        :param compression: int, default None
+            zlib level of the file, 1 is the fastest and 9 the smallest, 0 stores the parts uncompressed.
+            xlsxwriter's default level 6 when None. See benchmarks/bench_compression.py for the trade-off.
+        :param zip64: bool, default False
+            Allow parts over 4GB, Excel may warn about such files.
+        :param tmpdir: string, default None
+            Where xlsxwriter writes its temporary files, e.g. a tmpfs. The system temporary directory when None.
+        :return:
+        """
+        if output not in (None, 'bytes'):
+            raise ValueError("Unknown output %r, use None or 'bytes'." % (output,))
+
+        if output == 'bytes':
+            if filename is not None:
+                raise ValueError("output='bytes' returns the workbook from save(), it can't be written to %r too."
+                                 % (filename,))
+            filename = io.BytesIO()
+        elif filename is None:
+            raise ValueError("A filename or output='bytes' is required.")
+
+        self._filename = filename
+        self._output = output
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._async_lock = None
+        self._streaming = streaming
+        self._instrument = _Instrument(_hook.get() if hook is None else hook)
+        self._workbook = _Workbook(self._filename, {
+            'constant_memory': streaming,
+            'in_memory': hasattr(filename, 'write') and not streaming,
+            'use_zip64': zip64,
+            'tmpdir': tmpdir
+        }, compression=compression)
+        self._formats = FormatCache(self._workbook, self._instrument)
+        self._charts = []
+        self._lazy = lazy
+        self._plans = []
+
+        self._data_sheet = data_sheet
+        self._data_sheets = {}
+        self._blocks = {}
+        self._grids = {}
+
+    def _data_block(self, frame, date_parser=False, chart_type=None, data_sheet=None):
+        """ Write the frame to a data sheet, unless the same data was written there before.
+
+        Blocks are stacked downwards with a blank row between them, so the rows stay in order.
+        DataFrame chunks can't be hashed before they are consumed, they are always written.
+
+        :param frame: DataFrame or iterable of DataFrame
+        :param date_parser: bool, default False
+        :param chart_type: string, default None
+        :param data_sheet: string, default None
+            The data sheet of the workbook when None.
+        :return: DataBlock
+        """
+        data_sheet = self._data_sheet if data_sheet is None else data_sheet
+        key = (data_sheet, _frame_key(frame, date_parser)) if isinstance(frame, pd.DataFrame) else None
+        block = self._blocks.get(key)
+
+        if block is None:
+            if data_sheet not in self._data_sheets:
+                self._data_sheets[data_sheet] = [self._workbook.add_worksheet(data_sheet), 0]
+
+            worksheet, first_row = self._data_sheets[data_sheet]
+            block = _write_block(self._instrument, worksheet, frame, self._formats, chart_type, first_row=first_row,
+                                 date_parser=date_parser)
+            self._data_sheets[data_sheet][1] += block.rows + 2
+
+            if key is not None:
+                self._blocks[key] = block
+
+        return block
+
+    def _reduce_points(self, frame, max_points, keep_full=False):
+        """ Downsample a line or scatter frame to at most `max_points` rows.
+
+        :param frame: DataFrame or iterable of DataFrame
+        :param max_points: int
+        :param keep_full: bool, default False
+        :return: tuple, (reduced frame, full frame or None)
+        """
+        if not isinstance(frame, pd.DataFrame):
+            frame = pd.concat(frame, ignore_index=True)
+
+        return _downsample(frame, max_points), frame if keep_full else None
+
+    def _write_hidden(self, frame, chart_type=None):
+        """ Write a frame to a new hidden worksheet.
 
         :param frame: DataFrame
+        :param chart_type: string, default None
+        :return: DataBlock
+        """
+        worksheet = self._workbook.add_worksheet()
+        worksheet.hide()
+
+        return _write_block(self._instrument, worksheet, frame, self._formats, chart_type)
+
+    def _chart(self, frame, sheet_name, chart_type, subtype=None, date_parser=False, sheet=None, parts=None):
+        """ Create a Chart of the workbook.
+
+        :param frame: DataFrame or iterable of DataFrame
+        :param sheet_name: string
+        :param chart_type: string
+        :param subtype: string, default None
+        :param date_parser: bool, default False
+        :param sheet: string, default None
+            The grid sheet of the chart, it is created with the grid() defaults on first use.
+        :param parts: list, default None
+            The series columns of each chart from _plan_series, all charts share one data block. The frame
+            is checked against the series limit when None.
+        :return: Chart, or _ChartGroup for several parts
+        """
+        if parts is None:
+            frame, parts = _plan_series(frame)
+
+        charts = []
+
+        if sheet is not None:
+            if sheet not in self._grids:
+                self._add_grid(sheet)
+            grid = self._grids[sheet]
+
+            block = self._data_block(frame, date_parser, chart_type, grid.data_sheet)
+            for series in parts:
+                charts.append(Chart(self._workbook, frame=frame, chart_type=chart_type, subtype=subtype,
+                                    date_parser=date_parser, formats=self._formats, block=block,
+                                    instrument=self._instrument, worksheet=grid.worksheet, series=series))
+            grid.charts.extend(charts)
+        else:
+            block = self._data_block(frame, date_parser, chart_type) if self._data_sheet else None
+
+            for num, series in enumerate(parts):
+                charts.append(Chart(self._workbook, frame=frame, sheet_name=_part_name(sheet_name, num),
+                                    chart_type=chart_type, subtype=subtype, date_parser=date_parser,
+                                    formats=self._formats, block=block, instrument=self._instrument, series=series))
+                # The first chart writes the data, the others plot it from there.
+                block = charts[0].block
+
+        return charts[0] if len(charts) == 1 else _ChartGroup(charts)
+
+    def grid(self, sheet_name, cols=2, gap=20, data_sheet=None):
+        """ Add a worksheet that holds many charts in a grid, the builders place charts on it with `sheet`.
+
+        The charts fill the rows from left to right in the order they are created. save() anchors them
+        from their set_size dimensions, so a grid column is as wide as its widest chart and a row as high
+        as its tallest chart. Their data goes to a data sheet, not under the charts. A lazy ExcelChart adds
+        the worksheet in save(), in call order with the planned charts.
+
+        :param sheet_name: string
+        :param cols: int, default 2
+            Charts per row.
+        :param gap: int, default 20
+            Pixels between and around the charts.
+        :param data_sheet: string, default None
+            Where the data of the charts is written, identical frames are written once. The workbook's
+            data_sheet when it has one, else '<sheet_name> data'.
+        :return:
+        """
+        if not self._lazy:
+            return self._add_grid(sheet_name, cols, gap, data_sheet)
+
+        # A lazy grid is added by save() between the charts planned before and after it, as it would be eagerly.
+        if any(plan[0] is ExcelChart._add_grid and plan[1][0] == sheet_name for plan in self._plans):
+            raise ValueError('The grid %r already exists.' % sheet_name)
+        if cols < 1:
+            raise ValueError('A grid needs at least one column, got %r.' % cols)
+
+        self._plans.append((ExcelChart._add_grid, (sheet_name, cols, gap, data_sheet), {}, None))
+
+    def _add_grid(self, sheet_name, cols=2, gap=20, data_sheet=None):
+        """ Add the worksheet of a grid now, see grid().
+
+        :param sheet_name: string
+        :param cols: int, default 2
+        :param gap: int, default 20
+        :param data_sheet: string, default None
+        :return:
+        """
+        if sheet_name in self._grids:
+            raise ValueError('The grid %r already exists.' % sheet_name)
+        if cols < 1:
+            raise ValueError('A grid needs at least one column, got %r.' % cols)
+
+        data_sheet = data_sheet or self._data_sheet or '%s data' % sheet_name
+        self._grids[sheet_name] = _Grid(self._workbook.add_worksheet(sheet_name), cols, gap, data_sheet)
+
+    def _options(self, chart):
+        """ The 'options' span of a chart.
+
+        :param chart: Chart
+        :return: context manager
+        """
+        return self._instrument.span('options', chart.sheet_name, chart.chart_type)
+
+    @_deferrable
+    def column(self, frame, sheet_name=None, subtype=None, data_labels=False, overlap=0, gap=150, title=None,
+               font='Arial', legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None,
+               y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None,
+               aggregate=None, wide=None, x=None, series=None, values=None, columns=None, index=False, sheet=None
+               ):
+        """ Create a Column chart.
+
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param subtype: string, stacked percent_stacked, default None
         :param data_labels: bool, default False
@@ -996,48 +2489,108 @@ class ExcelChart(object):
         :param table: bool, default, False
         :param size: tuple, default None
         :param chart_sheet: string, default None
+        :param aggregate: dict, default None
+            Reduce the frame before it is written, {'by': keys, 'func': 'sum' 'mean' 'count' or a dict of
+            column -> reducer, 'top_n': int, 'other': 'Other'}. Groups beyond the top N are folded into one row.
+        :param wide: dict, default None
+            Frames over Excel's 255 series per chart. {'split': n} plots n series per chart, the charts share
+            one data block and are returned as a group. {'top_n': n, 'rank': 'variance' 'last' or 'total'} keeps
+            the n series with the highest score. Without it such a frame raises ValueError before anything is
+            written.
+        :param x: string, default None
+            The categories column of long data, see `series`.
+        :param series: string, default None
+            Pivot long data, one row per x, series and value, to a column of `values` per series with x as the
+            categories. A frame sorted by x with the series in the same order under every x is reshaped without
+            hashing. A missing pair is a blank cell. x, series and values are given together, a pair with several
+            rows raises ValueError, `aggregate` only runs after the pivot.
+        :param values: string, default None
+            The values column of long data, see `series`.
+        :param columns: list, default None
+            The header of a 2-D NumPy array, 0 to n - 1 when None. Renames the columns of other data.
+        :param index: bool, default False
+            Use the index of a DataFrame or Series as the categories column.
+        :param sheet: string, default None
+            Place the chart on this grid sheet instead of a worksheet of its own, see grid().
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='bar', subtype=subtype)
 
-        chart.add_series(data_labels=data_labels, overlap=overlap, gap=gap)
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, aggregate, wide)
 
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend)
-        chart.set_x_grid(major=x_grid, minor=False)
-        chart.set_y_grid(major=y_grid, minor=False)
-        chart.set_x_limit(limit=x_limit)
-        chart.set_y_limit(limit=y_limit)
+        chart = self._chart(frame, sheet_name, 'column', subtype=subtype, sheet=sheet, parts=parts)
 
-        if x_title:
-            chart.set_x_title(title=x_title, font=font)
+        with self._options(chart):
+            _style_axes(chart, data_labels=data_labels, overlap=overlap, gap=gap, title=title, font=font, legend=legend,
+                        x_grid=x_grid, y_grid=y_grid, x_limit=x_limit, y_limit=y_limit, x_title=x_title,
+                        y_title=y_title, x_reverse=x_reverse, y_reverse=y_reverse, table=table, size=size)
+
+        self._charts.append((chart, chart_sheet))
 
-        if y_title:
-            chart.set_y_title(title=y_title, font=font)
+        return chart
+
+    @_deferrable
+    def bar(self, frame, sheet_name=None, subtype=None, data_labels=False, overlap=0, gap=150, title=None,
+            font='Arial', legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None,
+            y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None,
+            aggregate=None, wide=None, x=None, series=None, values=None, columns=None, index=False, sheet=None
+            ):
+        """ Create a Bar chart.
 
-        if x_reverse:
-            chart.set_x_reverse()
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
+        :param sheet_name: string, default None
+        :param subtype: string, stacked percent_stacked, default None
+        :param data_labels: bool, default False
+        :param overlap: int, default 0
+        :param gap: int, default 150
+        :param title: string, default None
+        :param font: string, default 'Arial'
+        :param legend: string, default None
+        :param x_grid: bool, default False
+        :param y_grid: bool, default False
+        :param x_limit: tuple, default None
+        :param y_limit: tuple, default None
+        :param x_title: string, default None
+        :param y_title: string, default None
+        :param x_reverse: bool, default False
+        :param y_reverse: bool, default False
+        :param table: bool, default, False
+        :param size: tuple, default None
+        :param chart_sheet: string, default None
+        :param aggregate: dict, default None
+        :param wide: dict, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for aggregate, wide, x, series, values, columns, index and sheet.
+        :return:
+        """
 
-        if y_reverse:
-            chart.set_y_reverse()
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, aggregate, wide)
 
-        if table:
-            chart.set_table(font=font)
+        chart = self._chart(frame, sheet_name, 'bar', subtype=subtype, sheet=sheet, parts=parts)
 
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        with self._options(chart):
+            _style_axes(chart, data_labels=data_labels, overlap=overlap, gap=gap, title=title, font=font, legend=legend,
+                        x_grid=x_grid, y_grid=y_grid, x_limit=x_limit, y_limit=y_limit, x_title=x_title,
+                        y_title=y_title, x_reverse=x_reverse, y_reverse=y_reverse, table=table, size=size)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
     def line(self, frame, sheet_name=None, data_labels=False, overlap=0, gap=150, title=None, font='Arial',
              legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None, y_title=None,
-             x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None
+             x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None,
+             max_points=None, keep_full=False, wide=None, x=None, series=None, values=None, columns=None,
+             index=False, sheet=None
              ):
         """ Create a Line chart.
 
-        :param frame: DataFrame
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param data_labels: bool, default False
         :param title: string, default None
@@ -1056,46 +2609,49 @@ class ExcelChart(object):
         :param overlap: int, default 0
         :param gap: int, default 150
         :param table: bool, default, False
+        :param max_points: int, default None
+            Keep at most this many rows, each series keeps its minimum and maximum in every bucket of rows.
+            Below 2 rows per series plus 2, evenly spaced rows are kept instead. At least 2, the first and last row.
+        :param keep_full: bool, default False
+            Also write the full resolution data to a hidden worksheet when `max_points` is set.
+        :param wide: dict, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for wide, x, series, values, columns, index and sheet.
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='line')
-
-        chart.add_series(data_labels=data_labels, overlap=overlap, gap=gap)
 
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend)
-        chart.set_x_grid(major=x_grid, minor=False)
-        chart.set_y_grid(major=y_grid, minor=False)
-        chart.set_x_limit(limit=x_limit)
-        chart.set_y_limit(limit=y_limit)
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, wide=wide)
 
-        if x_title:
-            chart.set_x_title(title=x_title, font=font)
+        full = None
+        if max_points:
+            frame, full = self._reduce_points(frame, max_points, keep_full)
 
-        if y_title:
-            chart.set_y_title(title=y_title, font=font)
+        chart = self._chart(frame, sheet_name, 'line', sheet=sheet, parts=parts)
 
-        if x_reverse:
-            chart.set_x_reverse()
+        if full is not None:
+            self._write_hidden(full, chart.chart_type)
 
-        if y_reverse:
-            chart.set_y_reverse()
-
-        if table:
-            chart.set_table(font=font)
-
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        with self._options(chart):
+            _style_axes(chart, data_labels=data_labels, overlap=overlap, gap=gap, title=title, font=font, legend=legend,
+                        x_grid=x_grid, y_grid=y_grid, x_limit=x_limit, y_limit=y_limit, x_title=x_title,
+                        y_title=y_title, x_reverse=x_reverse, y_reverse=y_reverse, table=table, size=size)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
     def pie(self, frame, sheet_name=None, data_labels=False, title=None, font='Arial', legend=None, rotation=0,
-            size=None, chart_sheet=None):
+            size=None, chart_sheet=None, aggregate=None, x=None, series=None, values=None, columns=None, index=False,
+            sheet=None):
         """ Create a Pie chart.
 
-        :param frame: DataFrame
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param data_labels: bool, default False
         :param title: string, default None
@@ -1104,26 +2660,35 @@ class ExcelChart(object):
         :param rotation: int, default 0
         :param size: tuple, default None
         :param chart_sheet: string, default None
+        :param aggregate: dict, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for aggregate, x, series, values, columns, index and sheet.
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='pie')
-        chart.add_series(data_labels=data_labels)
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend, font=font)
-        chart.set_rotation(rotation)
 
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, aggregate)
+
+        chart = self._chart(frame, sheet_name, 'pie', sheet=sheet, parts=parts)
+        with self._options(chart):
+            _style_pie(chart, data_labels=data_labels, title=title, font=font, legend=legend, rotation=rotation,
+                       size=size)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
     def radar(self, frame, sheet_name=None, subtype=None, data_labels=False, title=None, font='Arial', legend=None,
-              major_grid=True, minor_grid=False, size=None, chart_sheet=None):
+              major_grid=True, minor_grid=False, size=None, chart_sheet=None, wide=None, x=None, series=None,
+              values=None, columns=None, index=False, sheet=None):
         """ Create a Radar chart.
 
-        :param frame: DataFrame
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param subtype: string, with_markers filled, default None
         :param data_labels: bool, default False
@@ -1134,28 +2699,38 @@ class ExcelChart(object):
         :param minor_grid: bool, default False
         :param size: tuple, default None
         :param chart_sheet: string, default None
+        :param wide: dict, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for wide, x, series, values, columns, index and sheet.
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='radar', subtype=subtype)
-        chart.add_series(data_labels=data_labels)
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend, font=font)
-        chart.set_y_grid(major=major_grid, minor=minor_grid)
 
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, wide=wide)
+
+        chart = self._chart(frame, sheet_name, 'radar', subtype=subtype, sheet=sheet, parts=parts)
+        with self._options(chart):
+            _style_radar(chart, data_labels=data_labels, title=title, font=font, legend=legend, major_grid=major_grid,
+                         minor_grid=minor_grid, size=size)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
     def scatter(self, frame, sheet_name=None, subtype=None, data_labels=False, overlap=0, gap=150, title=None,
                 font='Arial', legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None,
-                y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None
+                y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None,
+                max_points=None, keep_full=False, wide=None, x=None, series=None, values=None, columns=None,
+                index=False, sheet=None
                 ):
         """ Create a Scatter chart.
 
-        :param frame: DataFrame
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param subtype: string, straight_with_markers straight smooth_with_markers smooth, default None
         :param data_labels: bool, default False
@@ -1175,48 +2750,51 @@ class ExcelChart(object):
         :param table: bool, default, False
         :param size: tuple, default None
         :param chart_sheet: string, default None
+        :param max_points: int, default None
+            Keep at most this many rows, each series keeps its minimum and maximum in every bucket of rows.
+            Below 2 rows per series plus 2, evenly spaced rows are kept instead. At least 2, the first and last row.
+        :param keep_full: bool, default False
+            Also write the full resolution data to a hidden worksheet when `max_points` is set.
+        :param wide: dict, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for wide, x, series, values, columns, index and sheet.
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='scatter', subtype=subtype)
-
-        chart.add_series(data_labels=data_labels, overlap=overlap, gap=gap)
-
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend)
-        chart.set_x_grid(major=x_grid, minor=False)
-        chart.set_y_grid(major=y_grid, minor=False)
-        chart.set_x_limit(limit=x_limit)
-        chart.set_y_limit(limit=y_limit)
-
-        if x_title:
-            chart.set_x_title(title=x_title, font=font)
 
-        if y_title:
-            chart.set_y_title(title=y_title, font=font)
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, wide=wide)
 
-        if x_reverse:
-            chart.set_x_reverse()
+        full = None
+        if max_points:
+            frame, full = self._reduce_points(frame, max_points, keep_full)
 
-        if y_reverse:
-            chart.set_y_reverse()
+        chart = self._chart(frame, sheet_name, 'scatter', subtype=subtype, sheet=sheet, parts=parts)
 
-        if table:
-            chart.set_table(font=font)
+        if full is not None:
+            self._write_hidden(full, chart.chart_type)
 
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        with self._options(chart):
+            _style_axes(chart, data_labels=data_labels, overlap=overlap, gap=gap, title=title, font=font, legend=legend,
+                        x_grid=x_grid, y_grid=y_grid, x_limit=x_limit, y_limit=y_limit, x_title=x_title,
+                        y_title=y_title, x_reverse=x_reverse, y_reverse=y_reverse, table=table, size=size)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
     def area(self, frame, sheet_name=None, subtype=None, data_labels=False, overlap=0, gap=150, title=None,
              font='Arial', legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None,
-             y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None
+             y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None,
+             wide=None, x=None, series=None, values=None, columns=None, index=False, sheet=None
              ):
         """ Create a Area chart.
 
-        :param frame: DataFrame
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param subtype: string, stacked percent_stacked, default None
         :param data_labels: bool, default False
@@ -1236,45 +2814,37 @@ class ExcelChart(object):
         :param table: bool, default, False
         :param size: tuple, default None
         :param chart_sheet: string, default None
+        :param wide: dict, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for wide, x, series, values, columns, index and sheet.
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='area', subtype=subtype)
-
-        chart.add_series(data_labels=data_labels, overlap=overlap, gap=gap)
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend)
-        chart.set_x_grid(major=x_grid, minor=False)
-        chart.set_y_grid(major=y_grid, minor=False)
-        chart.set_x_limit(limit=x_limit)
-        chart.set_y_limit(limit=y_limit)
-
-        if x_title:
-            chart.set_x_title(title=x_title, font=font)
-
-        if y_title:
-            chart.set_y_title(title=y_title, font=font)
 
-        if x_reverse:
-            chart.set_x_reverse()
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, wide=wide)
 
-        if y_reverse:
-            chart.set_y_reverse()
+        chart = self._chart(frame, sheet_name, 'area', subtype=subtype, sheet=sheet, parts=parts)
 
-        if table:
-            chart.set_table(font=font)
-
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        with self._options(chart):
+            _style_axes(chart, data_labels=data_labels, overlap=overlap, gap=gap, title=title, font=font, legend=legend,
+                        x_grid=x_grid, y_grid=y_grid, x_limit=x_limit, y_limit=y_limit, x_title=x_title,
+                        y_title=y_title, x_reverse=x_reverse, y_reverse=y_reverse, table=table, size=size)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
     def doughnut(self, frame, sheet_name=None, data_labels=False, title=None, font='Arial', legend=None, rotation=0,
-                 size=None, chart_sheet=None):
+                 size=None, chart_sheet=None, aggregate=None, x=None, series=None, values=None, columns=None,
+                 index=False, sheet=None):
         """ Create a Doughnut chart.
 
-        :param frame: DataFrame
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param data_labels: bool, default False
         :param title: string, default None
@@ -1283,28 +2853,37 @@ class ExcelChart(object):
         :param rotation: int, default 0
         :param size: tuple, default None
         :param chart_sheet: string, default None
+        :param aggregate: dict, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for aggregate, x, series, values, columns, index and sheet.
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='doughnut')
-        chart.add_series(data_labels=data_labels)
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend, font=font)
-        chart.set_rotation(rotation)
 
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values, aggregate)
+
+        chart = self._chart(frame, sheet_name, 'doughnut', sheet=sheet, parts=parts)
+        with self._options(chart):
+            _style_pie(chart, data_labels=data_labels, title=title, font=font, legend=legend, rotation=rotation,
+                       size=size)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
     def stock(self, frame, sheet_name=None, data_labels=False, overlap=0, gap=150, title=None,
               font='Arial', legend=None, x_grid=False, y_grid=False, x_limit=None, y_limit=None, x_title=None,
-              y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None
+              y_title=None, x_reverse=False, y_reverse=False, table=False, size=None, chart_sheet=None,
+              x=None, series=None, values=None, columns=None, index=False, sheet=None
               ):
         """ Create a Area chart.
 
-        :param frame: DataFrame
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
         :param sheet_name: string, default None
         :param data_labels: bool, default False
         :param overlap: int, default 0
@@ -1323,48 +2902,283 @@ class ExcelChart(object):
         :param table: bool, default, False
         :param size: tuple, default None
         :param chart_sheet: string, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for x, series, values, columns, index and sheet.
         :return:
         """
-        chart = Chart(self._workbook, frame=frame, sheet_name=sheet_name, chart_type='stock', date_parser=True)
 
-        chart.add_series(data_labels=data_labels, overlap=overlap, gap=gap)
-        chart.set_title(title=title, font=font)
-        chart.set_legend(legend=legend)
-        chart.set_x_grid(major=x_grid, minor=False)
-        chart.set_y_grid(major=y_grid, minor=False)
-        chart.set_x_limit(limit=x_limit)
-        chart.set_y_limit(limit=y_limit)
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values)
+
+        chart = self._chart(frame, sheet_name, 'stock', date_parser=True, sheet=sheet, parts=parts)
 
-        if x_title:
-            chart.set_x_title(title=x_title, font=font)
+        with self._options(chart):
+            _style_axes(chart, data_labels=data_labels, overlap=overlap, gap=gap, title=title, font=font, legend=legend,
+                        x_grid=x_grid, y_grid=y_grid, x_limit=x_limit, y_limit=y_limit, x_title=x_title,
+                        y_title=y_title, x_reverse=x_reverse, y_reverse=y_reverse, table=table, size=size)
 
-        if y_title:
-            chart.set_y_title(title=y_title, font=font)
+        self._charts.append((chart, chart_sheet))
+
+        return chart
 
-        if x_reverse:
-            chart.set_x_reverse()
+    @_deferrable
+    def apply(self, spec, frame, sheet_name=None, chart_sheet=None, x=None, series=None, values=None, columns=None,
+              index=False, sheet=None):
+        """ Create a chart from a compiled ChartSpec.
 
-        if y_reverse:
-            chart.set_y_reverse()
+        :param spec: ChartSpec
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
+        :param sheet_name: string, default None
+        :param chart_sheet: string, default None
+        :param x: string, default None
+        :param series: string, default None
+        :param values: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+        :param sheet: string, default None
+            See column() for x, series, values, columns, index and sheet.
+        :return: Chart
+        """
 
-        if table:
-            chart.set_table(font=font)
+        frame, parts = _prepare_frame(frame, columns, index, x, series, values)
 
-        if size:
-            chart.set_size(width=size[0], height=size[1])
+        chart = self._chart(frame, sheet_name, spec.kind, subtype=spec.subtype, date_parser=spec.kind == 'stock',
+                            sheet=sheet, parts=parts)
+        with self._options(chart):
+            spec.apply(chart)
 
         self._charts.append((chart, chart_sheet))
 
         return chart
 
+    @_deferrable
+    def facet(self, frame, by, kind='line', sheet=None, cols=2, subtype=None, columns=None, index=False,
+              **options):
+        """ Create one chart per group of a long frame, small multiples on a grid sheet.
+
+        The frame is sorted by the keys once. The other columns of all groups are written as one block to the
+        grid's data sheet, the first column is the categories and the others are the series like for the
+        builders, and each chart plots the rows of its group. Rows with a missing key are left out.
+
+        :param frame: DataFrame, Series, NumPy array, dict of arrays, Arrow or Polars table, or iterable of chunks
+        :param by: string or list, the key columns
+        :param kind: string, column bar line pie radar scatter area doughnut stock, default 'line'
+        :param sheet: string, default None
+            The grid sheet, as `sheet` of the builders, see grid(). It is created with `cols` charts per row on first use, and named after
+            the keys when None.
+        :param cols: int, default 2
+        :param subtype: string, default None
+        :param columns: list, default None
+        :param index: bool, default False
+            See column() for columns and index.
+        :param options: the options of the builder of the kind, e.g. legend='bottom', see ChartSpec. Each
+            chart is titled with its group unless a title is given.
+        :return: _ChartGroup, the charts in key order
+        """
+
+        frame = _as_frame(frame, columns, index)
+
+        if not isinstance(frame, pd.DataFrame):
+            frame = pd.concat(frame, ignore_index=True)
+
+        spec = ChartSpec(kind, subtype, **options)
+        keys = by if isinstance(by, list) else [by]
+        data, labels, bounds = _facets(frame, keys)
+
+        if not labels:
+            raise ValueError('No groups of %s to chart.' % keys)
+
+        _plan_series(data)
+
+        sheet = sheet or ', '.join(str(key) for key in keys)
+        if sheet not in self._grids:
+            self._add_grid(sheet, cols=cols)
+        grid = self._grids[sheet]
+
+        block = self._data_block(data, kind == 'stock', kind, grid.data_sheet)
+        charts = []
+
+        for label, rows in zip(labels, bounds):
+            chart = Chart(self._workbook, frame=data, chart_type=kind, subtype=subtype, date_parser=kind == 'stock',
+                          formats=self._formats, block=block, instrument=self._instrument, worksheet=grid.worksheet,
+                          rows=rows)
+
+            with self._options(chart):
+                spec.apply(chart)
+                if not options.get('title'):
+                    chart.set_title(title=label, font=options.get('font', 'Arial'))
+
+            grid.charts.append(chart)
+            self._charts.append((chart, None))
+            charts.append(chart)
+
+        return _ChartGroup(charts)
+
+    @staticmethod
+    def append(path, sheet_name, new_rows, columns=None, index=False):
+        """ Append rows to a worksheet of a saved workbook and extend the chart ranges that end at its last row.
+
+        Only the sheet and the charts plotting it are rewritten, the other parts of the file are copied as
+        they are, so the cost follows the sheet and the new rows rather than the whole report.
+
+        :param path: string
+        :param sheet_name: string
+        :param new_rows: DataFrame or any data the builders accept, without the header
+        :param columns: list, default None
+        :param index: bool, default False
+        :return: int, the new last row, 1-based
+        """
+        from .append import append_rows
+
+        return append_rows(path, sheet_name, new_rows, columns, index)
+
+    def discard(self, chart):
+        """ Drop a chart planned by a lazy ExcelChart before save() builds it.
+
+        :param chart: the stand-in chart returned by the builder
+        :return:
+        """
+        for num, plan in enumerate(self._plans):
+            if plan[3] is not None and plan[3] is chart:
+                del self._plans[num]
+                return
+
+        raise ValueError('The chart is not planned, only charts of a lazy ExcelChart can be discarded before save().')
+
     def save(self):
         """ Save chart for Excel.
 
-        :return:
+        A lazy ExcelChart builds its planned charts first.
+
+        :return: bytes when output is 'bytes', else None
         """
+        plans, self._plans = self._plans, []
+        for builder, args, kwargs, lazy_chart in plans:
+            built = builder(self, *args, **kwargs)
+            if lazy_chart is not None:
+                lazy_chart._materialise(built)
+
+        for grid in self._grids.values():
+            grid.place()
+
         for chart, chart_sheet in self._charts:
             chart.save(chart_sheet)
-        self._workbook.close()
+
+        with self._instrument.span('close'):
+            self._workbook.close()
+
+        if self._output == 'bytes':
+            return self._filename.getvalue()
+
+    async def _run_async(self, method, *args, **kwargs):
+        """ Run a builder or save in the executor, one call at a time for this workbook.
+
+        :param method: bound method
+        :return: the result of the method
+        """
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        def call():
+            with self._lock:
+                return method(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+
+        async with self._async_lock:
+            return await loop.run_in_executor(self._executor or _default_executor(), call)
+
+    async def column_async(self, frame, **kwargs):
+        """ Create a Column chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of column()
+        :return: Chart
+        """
+        return await self._run_async(self.column, frame, **kwargs)
+
+    async def bar_async(self, frame, **kwargs):
+        """ Create a Bar chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of bar()
+        :return: Chart
+        """
+        return await self._run_async(self.bar, frame, **kwargs)
+
+    async def line_async(self, frame, **kwargs):
+        """ Create a Line chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of line()
+        :return: Chart
+        """
+        return await self._run_async(self.line, frame, **kwargs)
+
+    async def pie_async(self, frame, **kwargs):
+        """ Create a Pie chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of pie()
+        :return: Chart
+        """
+        return await self._run_async(self.pie, frame, **kwargs)
+
+    async def radar_async(self, frame, **kwargs):
+        """ Create a Radar chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of radar()
+        :return: Chart
+        """
+        return await self._run_async(self.radar, frame, **kwargs)
+
+    async def scatter_async(self, frame, **kwargs):
+        """ Create a Scatter chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of scatter()
+        :return: Chart
+        """
+        return await self._run_async(self.scatter, frame, **kwargs)
+
+    async def area_async(self, frame, **kwargs):
+        """ Create a Area chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of area()
+        :return: Chart
+        """
+        return await self._run_async(self.area, frame, **kwargs)
+
+    async def doughnut_async(self, frame, **kwargs):
+        """ Create a Doughnut chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of doughnut()
+        :return: Chart
+        """
+        return await self._run_async(self.doughnut, frame, **kwargs)
+
+    async def stock_async(self, frame, **kwargs):
+        """ Create a Stock chart in the executor without blocking the event loop.
+
+        :param frame: DataFrame or iterable of DataFrame chunks
+        :param kwargs: the arguments of stock()
+        :return: Chart
+        """
+        return await self._run_async(self.stock, frame, **kwargs)
+
+    async def save_async(self):
+        """ Save chart for Excel in the executor without blocking the event loop.
+
+        :return: bytes when output is 'bytes', else None
+        """
+        return await self._run_async(self.save)
 
 
 if __name__ == '__main__':
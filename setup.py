@@ -110,12 +110,18 @@ if __name__ == "__main__":
         "Operating System :: MacOS",
         "Operating System :: Unix",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2.7",
-        "Programming Language :: Python :: 3.4",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
     ]
 
+    # contextvars and asyncio.get_running_loop need 3.7, multiprocessing.shared_memory of render_batch 3.8
+    PYTHON_REQUIRES = ">=3.8"
+
     # Read requirements.txt, ignore comments
     try:
         REQUIRES = list()
@@ -148,6 +154,7 @@ if __name__ == "__main__":
         classifiers=CLASSIFIERS,
         platforms=PLATFORMS,
         license=LICENSE,
+        python_requires=PYTHON_REQUIRES,
         install_requires=REQUIRES,
     )
 
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ExcelChart.append tests, the workbooks are written by ExcelChart and read back with openpyxl.
+"""
+
+import datetime
+import os
+import re
+import struct
+import sys
+import zipfile
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from excelchart import ExcelChart  # noqa: E402
+
+layouts = [{}, {'streaming': True}, {'data_sheet': 'data'}]
+
+
+def values(path, sheet_name):
+    """ The cell values of a worksheet, row by row.
+
+    :param path: string
+    :param sheet_name: string
+    :return: list of list
+    """
+    worksheet = openpyxl.load_workbook(path)[sheet_name]
+    return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+
+def parts(path):
+    """ The parts of a workbook by name.
+
+    :param path: string
+    :return: dict
+    """
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def raw(path):
+    """ The compressed bytes of the parts of a workbook by name.
+
+    :param path: string
+    :return: dict
+    """
+    with open(path, 'rb') as stream:
+        data = stream.read()
+
+    with zipfile.ZipFile(path) as archive:
+        infos = archive.infolist()
+
+    blobs = {}
+    for info in infos:
+        # The local header is 30 bytes followed by the name and the extra field.
+        name_length, extra_length = struct.unpack('<HH', data[info.header_offset + 26:info.header_offset + 30])
+        start = info.header_offset + 30 + name_length + extra_length
+        blobs[info.filename] = data[start:start + info.compress_size]
+
+    return blobs
+
+
+def report(path, **options):
+    """ A workbook with a line chart of other data and a column chart of x, y and z, whose data is written last.
+
+    :param path: string
+    :return: string, the sheet holding the data of the column chart
+    """
+    ec = ExcelChart(path, **options)
+    ec.line(pd.DataFrame({'x': [1, 2], 'w': [5, 6]}), sheet_name='other')
+    ec.column(pd.DataFrame({'x': ['a', 'b', 'c'], 'y': [1, 2, 3], 'z': [1.5, 2.5, 3.5]}), sheet_name='sales')
+    ec.save()
+    return options.get('data_sheet', 'sales')
+
+
+def test_append_after_trailing_blank(tmp_path):
+    path = str(tmp_path / 'blank.xlsx')
+    ec = ExcelChart(path)
+    ec.line(pd.DataFrame({'x': ['a', 'b', 'c'], 'y': [1, 2, 3], 'z': [1, 2, np.nan]}))
+    ec.save()
+
+    assert ExcelChart.append(path, 'Sheet1', {'x': ['d'], 'y': [4], 'z': [4]}) == 5
+    assert values(path, 'Sheet1')[-2:] == [['c', 3, None], ['d', 4, 4]]
+
+
+@pytest.mark.parametrize('options', layouts)
+def test_append_extends_ranges_and_drops_caches(tmp_path, options):
+    path = str(tmp_path / 'ranges.xlsx')
+    sheet_name = report(path, **options)
+    before = parts(path)
+
+    last = ExcelChart.append(path, sheet_name, {'x': ['d', 'e'], 'y': [4, 5], 'z': [4.5, np.nan]})
+    rows = values(path, sheet_name)
+
+    assert last == len(rows)
+    assert rows[-3:] == [['c', 3, 3.5], ['d', 4, 4.5], ['e', 5, None]]
+
+    after = parts(path)
+    charts = [name for name in after if name.startswith('xl/charts/chart')]
+    changed = sorted(name for name in after if after[name] != before[name])
+    changed_charts = [after[name] for name in changed if name in charts]
+
+    assert len(changed_charts) == 1
+    ranges = re.findall(r'<c:f>([^<]*:[^<]*)</c:f>', changed_charts[0].decode('utf-8'))
+    assert len(ranges) == 4 and all(reference.endswith('$%d' % last) for reference in ranges)
+    # Only the caches of the series names are left.
+    assert b'<c:numCache>' not in changed_charts[0] and changed_charts[0].count(b'<c:strCache>') == 2
+
+
+@pytest.mark.parametrize('options', layouts)
+def test_append_copies_untouched_parts(tmp_path, options):
+    path = str(tmp_path / 'untouched.xlsx')
+    sheet_name = report(path, **options)
+    before = raw(path)
+
+    ExcelChart.append(path, sheet_name, {'x': ['d'], 'y': [4], 'z': [4.5]})
+
+    after = raw(path)
+    changed = [name for name in after if after[name] != before[name]]
+
+    assert sorted(after) == sorted(before)
+    assert len(changed) == 2
+    assert sum(name.startswith('xl/worksheets/sheet') for name in changed) == 1
+    assert sum(name.startswith('xl/charts/chart') for name in changed) == 1
+
+
+def test_append_blank_cells(tmp_path):
+    path = str(tmp_path / 'blanks.xlsx')
+    report(path)
+
+    ExcelChart.append(path, 'sales', {'x': ['d', None], 'y': [np.nan, 5], 'z': [np.inf, 5.5]})
+
+    assert values(path, 'sales')[-2:] == [['d', None, None], [None, 5, 5.5]]
+    with zipfile.ZipFile(path) as archive:
+        assert b'NaN' not in archive.read('xl/worksheets/sheet1.xml')
+
+
+def test_append_dates(tmp_path):
+    path = str(tmp_path / 'dates.xlsx')
+    ec = ExcelChart(path)
+    ec.line(pd.DataFrame({'date': pd.date_range('2024-01-30', periods=2), 'y': [1.0, 2.0]}))
+    ec.save()
+
+    ExcelChart.append(path, 'Sheet1', pd.DataFrame({'date': pd.date_range('2024-02-29', periods=2), 'y': [3.0, 4.0]}))
+
+    worksheet = openpyxl.load_workbook(path)['Sheet1']
+    assert [row[0].value for row in worksheet.iter_rows(min_row=2)] == [
+        datetime.datetime(2024, 1, 30), datetime.datetime(2024, 1, 31),
+        datetime.datetime(2024, 2, 29), datetime.datetime(2024, 3, 1)]
+    assert worksheet['A5'].number_format == worksheet['A2'].number_format
+
+
+def test_append_to_header_only_sheet(tmp_path):
+    path = str(tmp_path / 'header.xlsx')
+    ec = ExcelChart(path)
+    ec.line(pd.DataFrame({'x': pd.Series([], dtype=object), 'y': pd.Series([], dtype=float)}))
+    ec.save()
+
+    assert ExcelChart.append(path, 'Sheet1', {'x': ['a'], 'y': [1.0]}) == 2
+
+    worksheet = openpyxl.load_workbook(path)['Sheet1']
+    assert values(path, 'Sheet1') == [['x', 'y'], ['a', 1]]
+    assert worksheet['A1'].font.b and not worksheet['A2'].font.b and not worksheet['B2'].font.b
+
+
+def test_append_after_numeric_header_on_data_sheet(tmp_path):
+    path = str(tmp_path / 'numeric.xlsx')
+    ec = ExcelChart(path, data_sheet='data')
+    ec.column(pd.DataFrame({'a': ['x', 'y'], 'b': [1, 2], 'c': [3, 4], 'd': [5, 6]}))
+    ec.line(np.arange(6.).reshape(3, 2))
+    ec.save()
+
+    last = ExcelChart.append(path, 'data', np.array([[9., 9.]]))
+
+    assert values(path, 'data')[last - 2:] == [[4, 5, None, None], [9, 9, None, None]]
+
+
+def test_append_to_numeric_header_only_sheet(tmp_path):
+    path = str(tmp_path / 'numeric_header.xlsx')
+    ec = ExcelChart(path)
+    ec.line(np.empty((0, 2)))
+    ec.save()
+
+    assert ExcelChart.append(path, 'Sheet1', np.array([[9., 9.]])) == 2
+
+    worksheet = openpyxl.load_workbook(path)['Sheet1']
+    assert values(path, 'Sheet1') == [[0, 1], [9, 9]]
+    assert worksheet['A1'].font.b and not worksheet['A2'].font.b and not worksheet['B2'].font.b
+
+
+def test_append_extends_one_row_block(tmp_path):
+    path = str(tmp_path / 'one_row.xlsx')
+    ec = ExcelChart(path)
+    ec.line(pd.DataFrame({'x': ['a'], 'y': [1.0]}), sheet_name='L')
+    ec.save()
+
+    assert ExcelChart.append(path, 'L', {'x': ['b'], 'y': [2.0]}) == 3
+
+    with zipfile.ZipFile(path) as archive:
+        chart = archive.read('xl/charts/chart1.xml').decode('utf-8')
+    assert re.findall(r'<c:f>([^<]*)</c:f>', chart) == ['L!$B$1', 'L!$A$2:$A$3', 'L!$B$2:$B$3']
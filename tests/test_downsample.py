@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Downsampling tests, the rows kept by max_points.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from excelchart import ExcelChart  # noqa: E402
+from excelchart.excelchart import _min_max_rows  # noqa: E402
+
+
+@pytest.mark.parametrize('series', [1, 3, 20])
+@pytest.mark.parametrize('max_points', [2, 3, 10, 41, 42, 100, 999, 1000, 2000])
+def test_min_max_rows_keeps_at_most_max_points(series, max_points):
+    values = np.random.default_rng(0).random((1000, series))
+    values[::7, 0] = np.nan
+
+    rows = _min_max_rows(values, max_points)
+
+    assert len(rows) <= max_points
+    assert rows[0] == 0 and rows[-1] == len(values) - 1
+    assert (np.diff(rows) > 0).all()
+
+
+def test_min_max_rows_keeps_extremes():
+    values = np.zeros((1000, 1))
+    values[123, 0] = 5.
+    values[789, 0] = -5.
+
+    rows = _min_max_rows(values, 10)
+
+    assert 123 in rows and 789 in rows
+
+
+@pytest.mark.parametrize('max_points', [1, 0, -3])
+def test_min_max_rows_needs_two_points(max_points):
+    with pytest.raises(ValueError):
+        _min_max_rows(np.zeros((10, 2)), max_points)
+
+
+def test_line_with_many_series_keeps_max_points(tmp_path):
+    frame = pd.DataFrame(np.random.default_rng(1).random((1000, 20)))
+    frame.insert(0, 'x', np.arange(1000))
+
+    chart = ExcelChart(str(tmp_path / 'many.xlsx')).line(frame, max_points=10)
+
+    assert chart.block.rows == 10
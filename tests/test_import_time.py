@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Import time regression tests, the imports run in a fresh interpreter with -X importtime.
+
+The budgets are generous, the module checks catch pandas or numpy being imported eagerly again.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+HEAVY = ('pandas', 'numpy')
+
+# Cumulative microseconds.
+PACKAGE_BUDGET = 50000
+MODULE_BUDGET = 300000
+
+
+def import_times(code):
+    """ Run the code with -X importtime.
+
+    :param code: string
+    :return: dict, module name -> cumulative import time in microseconds
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, capture_output=True,
+                            text=True, check=True)
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.rstrip().endswith('imported package'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = max(times.get(name.strip(), 0), int(cumulative))
+
+    return times
+
+
+def test_package_metadata_is_cheap():
+    times = import_times('import excelchart; excelchart.__version__')
+
+    assert 'excelchart.excelchart' not in times
+    assert not [name for name in times if name.split('.')[0] in HEAVY + ('xlsxwriter',)]
+    assert times['excelchart'] < PACKAGE_BUDGET
+
+
+def test_excelchart_defers_pandas():
+    # importlib.import_module isn't reported by -X importtime, the submodule is imported directly.
+    times = import_times('import sys, excelchart.excelchart\n'
+                         'from excelchart import ExcelChart, ChartSpec\n'
+                         'assert not [name for name in %r if name in sys.modules]' % (HEAVY,))
+
+    assert 'excelchart.excelchart' in times
+    assert not [name for name in times if name.split('.')[0] in HEAVY]
+    assert times['excelchart.excelchart'] < MODULE_BUDGET
+
+
+def test_pandas_loaded_on_first_frame():
+    code = ('import sys, io\n'
+            'from excelchart import ExcelChart\n'
+            'ec = ExcelChart(io.BytesIO())\n'
+            'assert "pandas" not in sys.modules\n'
+            'import pandas as pd\n'
+            'ec.column(pd.DataFrame({"x": ["a", "b"], "y": [1, 2]}))\n'
+            'ec.save()\n')
+
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
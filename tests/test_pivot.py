@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Pivot tests, the long data of the builders' x, series and values against DataFrame.pivot.
+"""
+
+import os
+import sys
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from excelchart import ExcelChart  # noqa: E402
+from excelchart.excelchart import _pivot  # noqa: E402
+
+
+def long_frame():
+    """ Long data sorted by x with the series in the same order under every x.
+
+    :return: DataFrame
+    """
+    xs = np.repeat(np.arange(10, 60, 10), 3)
+    return pd.DataFrame({'x': xs, 's': ['b', 'a', 'c'] * 5, 'v': np.arange(15, dtype=float) / 2})
+
+
+def in_order(frame):
+    """ The frame as it is, sorted by x.
+
+    :param frame: DataFrame
+    :return: DataFrame
+    """
+    return frame
+
+
+def shuffled(frame):
+    """ The rows in random order.
+
+    :param frame: DataFrame
+    :return: DataFrame
+    """
+    return frame.sample(frac=1, random_state=0).reset_index(drop=True)
+
+
+def gapped(frame):
+    """ Without the pairs (20, a) and (50, b).
+
+    :param frame: DataFrame
+    :return: DataFrame
+    """
+    return frame.drop(index=[4, 12]).reset_index(drop=True)
+
+
+def reversed_series(frame):
+    """ Sorted by x, the series of the first x in their order and reversed under the others.
+
+    :param frame: DataFrame
+    :return: DataFrame
+    """
+    return pd.concat([frame.iloc[:3]] + [frame.iloc[start:start + 3].iloc[::-1] for start in range(3, 15, 3)],
+                     ignore_index=True)
+
+
+def expected(frame):
+    """ The pivot of DataFrame.pivot, x sorted and the series in the order they first appear.
+
+    :param frame: DataFrame
+    :return: DataFrame
+    """
+    pivot = frame.pivot(index='x', columns='s', values='v')[list(pd.unique(frame['s']))].reset_index()
+    pivot.columns = list(pivot.columns)
+    return pivot
+
+
+@pytest.mark.parametrize('arrange, fast', [(in_order, True), (shuffled, False), (gapped, False),
+                                           (reversed_series, False)])
+def test_pivot_matches_dataframe_pivot(monkeypatch, arrange, fast):
+    frame = arrange(long_frame())
+    factorized = []
+    factorize = pd.factorize
+
+    def spy(*args, **kwargs):
+        factorized.append(args)
+        return factorize(*args, **kwargs)
+
+    # Only the path for unsorted data factorizes x and the series.
+    monkeypatch.setattr(pd, 'factorize', spy)
+    result = _pivot(frame, 'x', 's', 'v')
+
+    assert bool(factorized) is not fast
+    pd.testing.assert_frame_equal(result, expected(frame), check_dtype=False, check_column_type=False)
+
+
+def test_pivot_paths_agree():
+    frame = long_frame()
+
+    pd.testing.assert_frame_equal(_pivot(frame, 'x', 's', 'v'), _pivot(shuffled(frame), 'x', 's', 'v')[
+        ['x', 'b', 'a', 'c']])
+
+
+def test_pivot_missing_pair_is_blank_cell(tmp_path):
+    path = str(tmp_path / 'gapped.xlsx')
+    ec = ExcelChart(path)
+    ec.line(gapped(long_frame()), x='x', series='s', values='v')
+    ec.save()
+
+    worksheet = openpyxl.load_workbook(path)['Sheet1']
+    rows = [[cell.value for cell in row] for row in worksheet.iter_rows()]
+    assert rows[0] == ['x', 'b', 'a', 'c']
+    assert rows[2] == [20, 1.5, None, 2.5]
+    assert rows[5] == [50, None, 6.5, 7]
+
+
+@pytest.mark.parametrize('arrange', [in_order, shuffled])
+def test_pivot_duplicate_pairs_raise(arrange):
+    frame = long_frame()
+    frame.loc[4, 's'] = 'b'
+
+    with pytest.raises(ValueError, match='several rows'):
+        _pivot(arrange(frame), 'x', 's', 'v')
+
+
+@pytest.mark.parametrize('names', [{'x': 'x'}, {'values': 'v'}, {'x': 'x', 'values': 'v'}, {'series': 's'}])
+def test_pivot_needs_all_three_columns(tmp_path, names):
+    with pytest.raises(ValueError, match='x, series and values'):
+        ExcelChart(str(tmp_path / 'partial.xlsx')).column(long_frame(), **names)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cell writing tests, string and categorical columns written by ExcelChart against xlsxwriter's write_string().
+"""
+
+import os
+import re
+import sys
+import zipfile
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+import xlsxwriter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import excelchart.excelchart  # noqa: E402
+from excelchart import ExcelChart  # noqa: E402
+
+
+def frame():
+    """ A frame with string, categorical and float columns and missing values in the first two.
+
+    :return: DataFrame
+    """
+    return pd.DataFrame({
+        'name': ['a', None, 'b & <c>', 'a', 'd'],
+        'kind': pd.Categorical(['y', np.nan, 'x', 'y', 'x'], categories=['x', 'y', 'unused']),
+        'value': [1.0, 2.0, 3.0, 4.0, 5.0]
+    })
+
+
+def reference(path, data):
+    """ Write the header and the string cells of a frame with write_string(), missing values are skipped.
+
+    :param path: string
+    :param data: DataFrame
+    :return:
+    """
+    workbook = xlsxwriter.Workbook(path)
+    worksheet = workbook.add_worksheet()
+
+    for col, name in enumerate(data.columns):
+        worksheet.write_string(0, col, name)
+        for row, value in enumerate(data[name]):
+            if isinstance(value, str):
+                worksheet.write_string(row + 1, col, value)
+            elif not pd.isna(value):
+                worksheet.write_number(row + 1, col, value)
+
+    workbook.close()
+
+
+def cells(path):
+    """ The cell values of the first worksheet, row by row.
+
+    :param path: string
+    :return: list of list
+    """
+    worksheet = openpyxl.load_workbook(path).worksheets[0]
+    return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+
+def shared_strings(path):
+    """ The count and unique count of the shared string table, and its strings.
+
+    :param path: string
+    :return: tuple, (count, unique count, set of strings)
+    """
+    with zipfile.ZipFile(path) as archive:
+        if 'xl/sharedStrings.xml' not in archive.namelist():
+            return 0, 0, set()
+        xml = archive.read('xl/sharedStrings.xml').decode('utf-8')
+
+    count, unique = re.search(r'<sst\b[^>]*?\bcount="(\d+)" uniqueCount="(\d+)"', xml).groups()
+    return int(count), int(unique), set(re.findall(r'<t[^>]*>([^<]*)</t>', xml))
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_strings_and_categories_match_write_string(tmp_path, streaming):
+    path = str(tmp_path / 'chart.xlsx')
+    expected = str(tmp_path / 'reference.xlsx')
+    data = frame()
+
+    ec = ExcelChart(path, streaming=streaming)
+    ec.line(data)
+    ec.save()
+    reference(expected, data)
+
+    assert cells(path) == cells(expected)
+    assert cells(path)[2] == [None, None, 2]
+    if not streaming:
+        assert shared_strings(path) == shared_strings(expected)
+
+
+def test_strings_without_coded_writer_match_write_string(tmp_path, monkeypatch):
+    path = str(tmp_path / 'chart.xlsx')
+    expected = str(tmp_path / 'reference.xlsx')
+    data = frame()
+    # What an xlsxwriter version outside the checked range gets.
+    monkeypatch.setattr(excelchart.excelchart, '_CellString', None)
+
+    ec = ExcelChart(path)
+    ec.line(data)
+    ec.save()
+    reference(expected, data)
+
+    assert cells(path) == cells(expected)
+    assert shared_strings(path) == shared_strings(expected)